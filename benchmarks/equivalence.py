@@ -0,0 +1,317 @@
+# Cross-engine equivalence check for the planners
+#
+# Every engine is run on random small instances and on the synthetic
+# generators, and compared with plan_city_e on Dinic: the same feasibility,
+# identical capacity-increase indicators, and results that pass the
+# linear-time checks in verify.py. Also covered: exact mode, plan_city_batch,
+# IncrementalPlanner and OnlinePlanner after changes, residual_edges against
+# the CSR residual network, and the problem_2 engines against binary_search.
+#
+#   python benchmarks/equivalence.py [--instances N] [--seed S]
+#
+# Exits with status 1 if any check fails.
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def check_result(instance, result, exact=False):
+
+    # None if `result` (from plan_city_d or plan_city_e) is a correct answer
+    # for `instance`, otherwise what is wrong with it
+    from problem_1.p1_e import plan_city_e
+    from problem_1.verify import verify_assignment, verify_capacity_increase
+
+    num_data_hubs = instance['num_data_hubs']
+    arguments = {name: instance[name] for name in
+                 ('num_data_hubs', 'num_service_providers', 'connections', 'provider_capacities')}
+
+    certificate = {}
+    reference = plan_city_e(**instance, solver='dinic', certificate=certificate)
+    feasible = len(reference) == num_data_hubs
+
+    if isinstance(result, bool):
+        if result != feasible:
+            return f"feasible={result}, Dinic says {feasible}"
+        return None
+    if feasible:
+        if len(result) != num_data_hubs:
+            return "capacity increase returned for a feasible instance"
+        if not verify_assignment(assignment=result, **arguments):
+            return "invalid assignment"
+        return None
+    if len(result) == num_data_hubs:
+        return "assignment returned for an infeasible instance"
+    if not exact:
+        if not verify_capacity_increase(capacity_increase=result, certificate=certificate, **arguments):
+            return "indicators fail verify_capacity_increase"
+        return None
+
+    # Exact mode: after the increase every hub with a connection can be served,
+    # and the increase is exactly the flow that was missing
+    raised = [capacity + increase for capacity, increase in zip(instance['provider_capacities'], result)]
+    connected = sum(1 for hub in range(num_data_hubs) if instance['connections'].get(hub))
+    after = {}
+    resolved = plan_city_e(**{**instance, 'provider_capacities': raised}, solver='dinic', certificate=after)
+    served = num_data_hubs if len(resolved) == num_data_hubs else len(after['partial_assignment'])
+    if served != connected:
+        return f"exact increase serves {served} of {connected} connected hubs"
+    if sum(result) != connected - len(certificate['partial_assignment']):
+        return f"exact increase {sum(result)} is not minimal"
+    return None
+
+
+def random_instance(rng):
+    num_data_hubs = rng.randint(1, 10)
+    num_service_providers = rng.randint(1, 6)
+    providers = range(num_data_hubs, num_data_hubs + num_service_providers)
+    connections = {hub: rng.sample(providers, rng.randint(0, num_service_providers))
+                   for hub in range(num_data_hubs) if rng.random() < 0.95}
+    # Capacities above SLOT_EXPANSION_LIMIT send some instances past the matching fast path
+    provider_capacities = [0] * num_data_hubs + [rng.randint(0, 6) for _ in providers]
+
+    # Valid preliminary assignment: connected and within capacity
+    preliminary_assignment = {}
+    load = {}
+    for hub, hub_providers in connections.items():
+        if hub_providers and rng.random() < 0.3:
+            provider = rng.choice(hub_providers)
+            if load.get(provider, 0) < provider_capacities[provider]:
+                preliminary_assignment[hub] = provider
+                load[provider] = load.get(provider, 0) + 1
+
+    return {
+        'num_data_hubs': num_data_hubs,
+        'num_service_providers': num_service_providers,
+        'connections': connections,
+        'provider_capacities': provider_capacities,
+        'preliminary_assignment': preliminary_assignment,
+    }
+
+
+def check_planners(instance):
+    from problem_1.p1_d import plan_city_d, SOLVERS
+    from problem_1.p1_e import plan_city_e
+    from problem_1.matching import supports_matching
+
+    reference = plan_city_e(**instance, solver='dinic')
+    matching = supports_matching(**instance)
+    for solver in SOLVERS:
+        if solver == 'hopcroft_karp' and not matching:
+            continue
+        for greedy in (False, True):
+            name = f"solver={solver} greedy={greedy}"
+            yield f"plan_city_d {name}", check_result(instance, plan_city_d(**instance, solver=solver, greedy=greedy))
+            result = plan_city_e(**instance, solver=solver, greedy=greedy)
+            error = check_result(instance, result)
+            if error is None and len(reference) != instance['num_data_hubs'] and result != reference:
+                error = "indicators differ from Dinic"
+            yield f"plan_city_e {name}", error
+
+    yield "plan_city_e exact", check_result(instance, plan_city_e(**instance, exact=True), exact=True)
+
+
+def check_batch(instance, rng):
+    from problem_1.batch import plan_city_batch
+    from problem_1.p1_e import plan_city_e
+
+    n = instance['num_data_hubs']
+    scenarios = [
+        {},
+        {'provider_capacities': [0] * n + [rng.randint(0, 6) for _ in range(instance['num_service_providers'])]},
+        {'preliminary_assignment': instance['preliminary_assignment']},
+    ]
+    for scenario, result in zip(scenarios, plan_city_batch(instance, scenarios)):
+        scenario_instance = {**instance, 'preliminary_assignment': {}, **scenario}
+        error = check_result(scenario_instance, result)
+        if error is None and len(result) != n and result != plan_city_e(**scenario_instance, solver='dinic'):
+            error = "indicators differ from Dinic"
+        yield f"plan_city_batch {sorted(scenario)}", error
+
+
+def check_incremental(instance, rng):
+    from problem_1.incremental import IncrementalPlanner
+    from problem_1.p1_e import plan_city_e
+
+    n = instance['num_data_hubs']
+    k = instance['num_service_providers']
+    planner = IncrementalPlanner(**instance)
+    changes = ['initial']
+    for step in range(6):
+        current = {
+            'num_data_hubs': n,
+            'num_service_providers': k,
+            'connections': planner.connections,
+            'provider_capacities': planner.provider_capacities,
+            'preliminary_assignment': {},
+        }
+        result = planner.result()
+        error = check_result(current, result)
+        if error is None and len(result) != n and result != plan_city_e(**current, solver='dinic'):
+            error = "indicators differ from Dinic"
+        yield f"IncrementalPlanner after {', '.join(changes)}", error
+
+        hub = rng.randrange(n)
+        provider = rng.randrange(n, n + k)
+        change = rng.randrange(4)
+        if change == 0:
+            planner.add_connection(hub, provider)
+            changes.append(f"add_connection({hub}, {provider})")
+        elif change == 1:
+            planner.remove_connection(hub, provider)
+            changes.append(f"remove_connection({hub}, {provider})")
+        elif change == 2:
+            capacity = rng.randint(0, 5)
+            planner.set_capacity(provider, capacity)
+            changes.append(f"set_capacity({provider}, {capacity})")
+        else:
+            planner.fail_provider(provider)
+            changes.append(f"fail_provider({provider})")
+
+
+def check_online(instance, rng):
+    from problem_1.online import OnlinePlanner
+    from problem_1.p1_e import plan_city_e
+
+    n = instance['num_data_hubs']
+    planner = OnlinePlanner(n, instance['num_service_providers'], instance['provider_capacities'])
+    arrived = {}
+    for hub in rng.sample(range(n), n):
+        arrived[hub] = list(instance['connections'].get(hub, ()))
+        planner.arrive(hub, arrived[hub])
+
+        # The online assignment must be a maximum one for the hubs seen so far
+        certificate = {}
+        offline = plan_city_e(n, instance['num_service_providers'], arrived, instance['provider_capacities'], {},
+                              solver='dinic', certificate=certificate)
+        best = n if len(offline) == n else len(certificate['partial_assignment'])
+        assignment = planner.result()
+        load = {}
+        error = None
+        for assigned_hub, provider in assignment.items():
+            load[provider] = load.get(provider, 0) + 1
+            if provider not in arrived.get(assigned_hub, ()) or load[provider] > instance['provider_capacities'][provider]:
+                error = f"invalid assignment {assignment}"
+        if error is None and len(assignment) != min(best, len(arrived)):
+            error = f"serves {len(assignment)} hubs, maximum is {best}"
+        yield f"OnlinePlanner after {len(arrived)} arrivals", error
+
+
+def check_residual_edges(instance):
+    from problem_1.flow_network import build_flow_network, apply_preliminary_assignment
+    from problem_1.p1_a import residual_edges, SOURCE_ID, SINK_ID
+
+    # Positive residual capacities of the CSR network, in residual_edges' node ids
+    network = build_flow_network(instance['num_data_hubs'], instance['num_service_providers'],
+                                 instance['connections'], instance['provider_capacities'])
+    apply_preliminary_assignment(network, instance['preliminary_assignment'])
+    names = {network.source: SOURCE_ID, network.sink: SINK_ID}
+    expected = {}
+    for u in range(network.num_nodes):
+        for e in range(network.start[u], network.start[u + 1]):
+            if network.cap[e] > 0:
+                edge = (names.get(u, u - 1), names.get(network.head[e], network.head[e] - 1))
+                expected[edge] = expected.get(edge, 0) + network.cap[e]
+
+    tails, heads, capacities, _ = residual_edges(**instance)
+    actual = {}
+    for u, v, capacity in zip(tails, heads, capacities):
+        actual[(u, v)] = actual.get((u, v), 0) + capacity
+    yield "residual_edges", None if actual == expected else "differs from the CSR residual network"
+
+
+def check_problem_2(rng):
+    # problem_2 modules import each other as top-level scripts; main() puts the directory on sys.path
+    from p2_a import linear_search
+    from p2_b import binary_search, prefix_sum_search, vectorized_search
+    from catalog import SupplierCatalog, pruned_search
+    from tracker import WasteTracker
+
+    # vectorized_search needs numpy, which is optional
+    engines = [linear_search, prefix_sum_search, pruned_search]
+    if importlib.util.find_spec('numpy') is not None:
+        engines.append(vectorized_search)
+
+    packages = [rng.randint(1, 20) for _ in range(rng.randint(0, 8))]
+    boxes = [[rng.randint(1, 20) for _ in range(rng.randint(0, 4))] for _ in range(rng.randint(0, 5))]
+    expected = binary_search(packages, boxes)
+    for engine in engines:
+        result = engine(packages, boxes)
+        yield engine.__name__, None if result == expected else f"{result} != binary_search {expected}"
+
+    catalog = SupplierCatalog(boxes)
+    for name, result in (('SupplierCatalog.min_waste', catalog.min_waste(packages)),
+                         ('SupplierCatalog.min_waste_pruned', catalog.min_waste_pruned(packages)),
+                         ('SupplierCatalog.top_k', (catalog.top_k(packages, 1) or [(-1, None)])[0][0])):
+        if packages:
+            yield name, None if result == expected else f"{result} != binary_search {expected}"
+
+    tracker = WasteTracker(catalog)
+    streamed = []
+    for package_size in packages:
+        streamed.append(package_size)
+        result = tracker.add_package(package_size)
+        expected = binary_search(streamed, boxes)
+        yield "WasteTracker.add_package", None if result == expected else f"{result} != binary_search {expected}"
+    while streamed:
+        package_size = rng.choice(streamed)
+        streamed.remove(package_size)
+        result = tracker.remove_package(package_size)
+        expected = binary_search(streamed, boxes)
+        yield "WasteTracker.remove_package", None if result == expected else f"{result} != binary_search {expected}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-engine equivalence check for the planners")
+    parser.add_argument('--instances', type=int, default=300, help="random instances per check")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    from problem_1.generators import GENERATORS
+
+    rng = random.Random(args.seed)
+    checks = 0
+    failures = []
+
+    def record(label, results):
+        # An engine that raises fails the check and ends its group
+        nonlocal checks
+        try:
+            for name, error in results:
+                checks += 1
+                if error is not None:
+                    failures.append(f"{label}: {name}: {error}")
+        except Exception as error:
+            checks += 1
+            failures.append(f"{label}: raised {error!r}")
+
+    for i in range(args.instances):
+        instance = random_instance(rng)
+        label = f"random instance {i}"
+        record(label, check_planners(instance))
+        record(label, check_batch(instance, rng))
+        record(label, check_incremental(instance, rng))
+        record(label, check_online(instance, rng))
+        record(label, check_residual_edges(instance))
+        record(f"problem_2 case {i}", check_problem_2(rng))
+
+    for generator, make in GENERATORS.items():
+        for num_edges in (100, 2000):
+            instance = make(num_edges, args.seed)
+            record(f"{generator}/{num_edges}", check_planners(instance))
+
+    for line in failures:
+        print(f"MISMATCH {line}")
+    print(f"{checks} checks, {len(failures)} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, os.path.join(ROOT, 'problem_2'))
+    sys.exit(main())
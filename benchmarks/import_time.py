@@ -0,0 +1,91 @@
+# Import-time guard for the problem_1 package
+#
+# Each module is imported in a fresh interpreter (as a short-lived worker
+# would) and the median over several runs is compared with a budget. Budgets
+# are multiples of the import time of a reference stdlib module measured in
+# the same run, so the guard does not depend on how fast the machine is.
+# Modules that must stay lazy are checked as well: the solver imports may
+# not pull them in (networkx alone costs hundreds of milliseconds).
+#
+#   python benchmarks/import_time.py [--runs N] [--json]
+#
+# Exits with status 1 on a regression.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Comparable in size to the solver modules, and not loaded at interpreter start-up
+REFERENCE = 'json'
+
+# Module -> import budget as a multiple of the REFERENCE import time
+TARGETS = {
+    'problem_1': 0.5,
+    'problem_1.p1_d': 2.5,
+    'problem_1.p1_e': 2.5,
+    'problem_1.incremental': 3,
+    'problem_1.p1_a': 2,
+}
+
+# Heavy or optional modules that none of the targets may import eagerly
+LAZY_MODULES = ('networkx', 'matplotlib', 'numpy', 'multiprocessing', 'concurrent.futures', 'sqlite3')
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(elapsed, ','.join(m for m in {lazy!r} if m in sys.modules))
+"""
+
+
+def measure(module, runs):
+    times = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(module=module, lazy=LAZY_MODULES)],
+                                cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]) * 1000)
+        if len(output) > 1:
+            loaded.update(output[1].split(','))
+    return statistics.median(times), sorted(loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time guard for the problem_1 package")
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--json', action='store_true', help="print one JSON object per module")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so compilation is not measured
+    subprocess.run([sys.executable, '-c', '; '.join(f"import {m}" for m in TARGETS)], cwd=ROOT, check=True)
+
+    reference_ms, _ = measure(REFERENCE, args.runs)
+    if not args.json:
+        print(f"{'reference: ' + REFERENCE:<24} {reference_ms:7.2f} ms")
+
+    failed = False
+    for module, ratio in TARGETS.items():
+        budget_ms = ratio * reference_ms
+        median_ms, loaded = measure(module, args.runs)
+        ok = median_ms <= budget_ms and not loaded
+        failed |= not ok
+
+        if args.json:
+            print(json.dumps({'module': module, 'median_ms': round(median_ms, 3), 'budget_ms': round(budget_ms, 3),
+                              'reference_ms': round(reference_ms, 3), 'eager_imports': loaded, 'ok': ok}))
+        else:
+            status = "ok" if ok else "REGRESSION"
+            extra = f"  eagerly imports {', '.join(loaded)}" if loaded else ""
+            print(f"{module:<24} {median_ms:7.2f} ms  (budget {budget_ms:.2f} ms)  {status}{extra}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+# Scaling benchmark for the city planners
+#
+# Every (generator, size, planner) case runs in a fresh interpreter, so peak
+# memory is the process's own high-water mark: the solve's peak RSS above
+# the RSS with the instance already built. RSS grows in pages, so small
+# cases also get one extra tracemalloc run (peak Python allocations; it is
+# too slow to trace beyond --traced-max-edges). Runtime is the best of
+# --repeat untraced runs. Every result is also checked for correctness
+# (equivalence.check_result: verify.py plus a Dinic reference). Results go to
+# a JSON file; invalid results, and with --baseline cases slower than
+# --tolerance times the baseline, are reported and the exit status is 1.
+#
+#   python benchmarks/scaling.py                            # 10^2 .. 10^5 edges
+#   python benchmarks/scaling.py --sizes 100,1000000 --output results.json
+#   python benchmarks/scaling.py --baseline results.json
+#
+# New engines are added to PLANNERS as (module, function, keyword arguments,
+# largest instance in edges it is run on).
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLANNERS = {
+    'plan_city_d': ('problem_1.p1_d', 'plan_city_d', {}, None),
+    'plan_city_d[push_relabel]': ('problem_1.p1_d', 'plan_city_d', {'solver': 'push_relabel'}, None),
+    'plan_city_d[edmonds_karp]': ('problem_1.p1_d', 'plan_city_d', {'solver': 'edmonds_karp'}, 10 ** 4),
+    'plan_city_d[greedy]': ('problem_1.p1_d', 'plan_city_d', {'greedy': True}, None),
+    'plan_city_e': ('problem_1.p1_e', 'plan_city_e', {}, None),
+    'plan_city_e[dinic]': ('problem_1.p1_e', 'plan_city_e', {'solver': 'dinic'}, None),
+    'plan_city_e[greedy]': ('problem_1.p1_e', 'plan_city_e', {'greedy': True}, None),
+    'plan_city_e[exact]': ('problem_1.p1_e', 'plan_city_e', {'exact': True}, None),
+}
+
+DEFAULT_SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5)
+
+
+def _peak_rss_kb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _summarize(instance, result):
+    if isinstance(result, bool):
+        return {'feasible': result}
+    if len(result) == instance['num_data_hubs']:
+        return {'feasible': True}
+    return {'feasible': False, 'capacity_increase': sum(result)}
+
+
+def run_case(generator, num_edges, planner, seed, repeat, traced_max_edges):
+    # Runs inside the child interpreter
+    sys.path.insert(0, ROOT)
+    from problem_1.generators import GENERATORS
+    from equivalence import check_result
+
+    module, function, options, _ = PLANNERS[planner]
+    solve = getattr(importlib.import_module(module), function)
+
+    instance = GENERATORS[generator](num_edges, seed)
+    base_rss = _peak_rss_kb()
+
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = solve(**instance, **options)
+        times.append(time.perf_counter() - started)
+    peak_rss_kb = max(0, _peak_rss_kb() - base_rss)
+
+    peak_alloc_kb = None
+    if num_edges <= traced_max_edges:
+        tracemalloc.start()
+        solve(**instance, **options)
+        peak_alloc_kb = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    error = check_result(instance, result, exact=options.get('exact', False))
+
+    return {
+        'generator': generator,
+        'edges': sum(len(providers) for providers in instance['connections'].values()),
+        'target_edges': num_edges,
+        'hubs': instance['num_data_hubs'],
+        'providers': instance['num_service_providers'],
+        'planner': planner,
+        'seed': seed,
+        'seconds': min(times),
+        'peak_rss_kb': peak_rss_kb,
+        'peak_alloc_kb': peak_alloc_kb,
+        'valid': error is None,
+        'error': error,
+        **_summarize(instance, result),
+    }
+
+
+def cases(generators, sizes, planners):
+    for generator in generators:
+        for num_edges in sizes:
+            for planner in planners:
+                limit = PLANNERS[planner][3]
+                if limit is None or num_edges <= limit:
+                    yield generator, num_edges, planner
+
+
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path) as f:
+        baseline = {(r['generator'], r['target_edges'], r['planner']): r for r in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        if not result['valid']:
+            continue # reported by invalid_results whether or not there is a baseline
+        before = baseline.get((result['generator'], result['target_edges'], result['planner']))
+        if before is None:
+            continue
+        if result['feasible'] != before['feasible']:
+            regressions.append(f"{result['planner']} on {result['generator']}/{result['target_edges']}: "
+                               f"feasible {before['feasible']} -> {result['feasible']}")
+        # Cases under 10 ms are dominated by timer and scheduler noise
+        elif result['seconds'] > tolerance * before['seconds'] and result['seconds'] > 1e-2:
+            regressions.append(f"{result['planner']} on {result['generator']}/{result['target_edges']}: "
+                               f"{before['seconds']:.4f}s -> {result['seconds']:.4f}s")
+    return regressions
+
+
+def invalid_results(results):
+    return [f"{r['planner']} on {r['generator']}/{r['target_edges']}: {r['error']}" for r in results if not r['valid']]
+
+
+def main():
+    from problem_1.generators import GENERATORS
+
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the city planners")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated target edge counts")
+    parser.add_argument('--generators', default=','.join(GENERATORS))
+    parser.add_argument('--planners', default=','.join(PLANNERS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', default='scaling_results.json')
+    parser.add_argument('--baseline', help="earlier --output file to compare against")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="allowed slowdown factor against --baseline")
+    parser.add_argument('--traced-max-edges', type=int, default=10 ** 4,
+                        help="largest case that also gets a tracemalloc run")
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        generator, num_edges, planner = json.loads(args.case)
+        print(json.dumps(run_case(generator, num_edges, planner, args.seed, args.repeat, args.traced_max_edges)))
+        return 0
+
+    results = []
+    for generator, num_edges, planner in cases(args.generators.split(','), [int(s) for s in args.sizes.split(',')],
+                                               args.planners.split(',')):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--seed', str(args.seed),
+                                 '--repeat', str(args.repeat), '--traced-max-edges', str(args.traced_max_edges),
+                                 '--case', json.dumps([generator, num_edges, planner])],
+                                cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+        results.append(result)
+        traced = f"{result['peak_alloc_kb']:>9} KB" if result['peak_alloc_kb'] is not None else f"{'-':>12}"
+        print(f"{generator:<16} {result['edges']:>9} edges  {planner:<26} {result['seconds']:10.4f}s "
+              f"rss {result['peak_rss_kb']:>9} KB  alloc {traced}  feasible={result['feasible']}"
+              f"{'' if result['valid'] else '  INVALID'}")
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    failed = False
+    for line in invalid_results(results):
+        print(f"INVALID {line}")
+        failed = True
+    if args.baseline:
+        for line in compare(results, args.baseline, args.tolerance):
+            print(f"REGRESSION {line}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, ROOT)
+    sys.exit(main())
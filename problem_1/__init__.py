@@ -0,0 +1,44 @@
+# Problem 1 - City planning package
+#
+# Entry points are loaded on first attribute access, so `import problem_1`
+# costs almost nothing and `from problem_1 import plan_city_d` only loads
+# the pure-Python solver modules. networkx and matplotlib are imported by
+# plan_city_a when it draws; numpy, sqlite3 and multiprocessing are also
+# only imported by the calls that use them.
+
+import importlib
+
+_EXPORTS = {
+    'plan_city_a': 'p1_a',
+    'residual_edges': 'p1_a',
+    'plan_city_d': 'p1_d',
+    'plan_city_e': 'p1_e',
+    'IncrementalPlanner': 'incremental',
+    'OnlinePlanner': 'online',
+    'HallViolation': 'online',
+    'BaseCity': 'batch',
+    'plan_city_batch': 'batch',
+    'SolverStats': 'stats',
+    'GENERATORS': 'generators',
+    'verify_assignment': 'verify',
+    'verify_capacity_increase': 'verify',
+    'PlanCache': 'cache',
+    'instance_key': 'cache',
+    'write_instance': 'instance_format',
+    'load_instance': 'instance_format',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
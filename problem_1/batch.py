@@ -0,0 +1,133 @@
+# Problem 1 - Batch what-if evaluation over one base city
+
+import time
+
+from .flow_network import FlowNetwork, build_flow_network, apply_preliminary_assignment, dinic_max_flow
+from .p1_e import network_result
+
+# Per-process base state, set once per worker by _init_worker
+_base = None
+
+
+class BaseCity:
+
+    # Immutable structures shared by every scenario: the CSR arrays
+    # (start/head/rev), the original capacities, the edge ids of every
+    # S -> hub / provider -> T edge (from build_flow_network, so the build
+    # stays O(E)), and the base maximum flow as
+    # (hub -> (provider, hub_edge)).
+
+    def __init__(self, num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+        self.num_data_hubs = num_data_hubs
+        self.num_service_providers = num_service_providers
+        self.provider_capacities = list(provider_capacities)
+
+        network = build_flow_network(num_data_hubs, num_service_providers, connections, provider_capacities)
+        self.start = network.start
+        self.head = network.head
+        self.rev = network.rev
+        self.cap = network.cap[:]
+        self.source = network.source
+        self.sink = network.sink
+        self.source_edge = network.source_edge
+        self.sink_edge = network.sink_edge
+
+        # Base max flow; the saturated hub -> provider edges are the warm start
+        apply_preliminary_assignment(network, preliminary_assignment)
+        dinic_max_flow(network)
+        self.base_assignment = {}
+        for hub in range(num_data_hubs):
+            hub_idx = hub + 1
+            for e in range(network.start[hub_idx], network.start[hub_idx + 1]):
+                if network.head[e] != self.source and network.cap[e] == 0:
+                    self.base_assignment[hub] = (network.head[e] - 1, e)
+                    break
+
+    def solve(self, scenario):
+        provider_capacities = scenario.get('provider_capacities', self.provider_capacities)
+        preliminary_assignment = scenario.get('preliminary_assignment', {})
+
+        # Fresh residual capacities on the shared structure
+        cap = self.cap[:]
+        for j, e in enumerate(self.sink_edge):
+            cap[e] = provider_capacities[self.num_data_hubs + j]
+        network = FlowNetwork(self.source, self.sink, self.start, self.head, cap, self.rev, self.source_edge,
+                              self.sink_edge)
+
+        # Scenario's own preliminary assignment first, then every base-flow path that still fits
+        total_flow = apply_preliminary_assignment(network, preliminary_assignment)
+        for hub, (provider, e) in self.base_assignment.items():
+            sink_edge = self.sink_edge[provider - self.num_data_hubs]
+            if hub in preliminary_assignment or cap[sink_edge] <= 0:
+                continue
+            network.push(self.source_edge[hub], 1)
+            network.push(e, 1)
+            network.push(sink_edge, 1)
+            total_flow += 1
+
+        total_flow += dinic_max_flow(network)
+        return network_result(network, total_flow, self.num_data_hubs, self.num_service_providers,
+                              provider_capacities)
+
+
+def _init_worker(base):
+    global _base
+    _base = base
+
+
+def _solve_scenario(scenario):
+    return _base.solve(scenario)
+
+
+def plan_city_batch(base_instance, scenarios, workers=None, report=None):
+
+    started = time.perf_counter()
+    base = BaseCity(base_instance['num_data_hubs'], base_instance['num_service_providers'],
+                    base_instance['connections'], base_instance['provider_capacities'],
+                    base_instance.get('preliminary_assignment', {}))
+    built = time.perf_counter()
+
+    if workers is None:
+        results = [base.solve(scenario) for scenario in scenarios]
+    else:
+        # The base city is shipped to each worker once, not once per scenario
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(base,)) as executor:
+            chunksize = max(1, len(scenarios) // (4 * workers))
+            results = list(executor.map(_solve_scenario, scenarios, chunksize=chunksize))
+
+    finished = time.perf_counter()
+    if report is not None:
+        report['scenarios'] = len(scenarios)
+        report['build_seconds'] = built - started
+        report['solve_seconds'] = finished - built
+        report['scenarios_per_second'] = len(scenarios) / (finished - built) if finished > built else float('inf')
+
+    return results
+
+
+if __name__ == "__main__":
+    # Input from Listing 1, with a few what-if capacity variants
+    base_instance = {
+        'num_data_hubs': 5,
+        'num_service_providers': 5,
+        'connections': {
+            0: [5, 7, 8],
+            1: [5, 8],
+            2: [7, 8, 9],
+            3: [5, 6, 8, 9],
+            4: [5, 6, 7, 8]
+        },
+        'provider_capacities': [0]*5 + [0, 1, 0, 2, 2],
+        'preliminary_assignment': {0: 8, 1: 8, 2: 9, 3: 9}
+    }
+    scenarios = [
+        {},
+        {'provider_capacities': [0]*5 + [0, 0, 0, 2, 2]},
+        {'provider_capacities': [0]*5 + [1, 0, 0, 2, 2]},
+        {'preliminary_assignment': {4: 6}},
+    ]
+    report = {}
+    for scenario, result in zip(scenarios, plan_city_batch(base_instance, scenarios, report=report)):
+        print(f"{scenario}: {result}")
+    print(f"Throughput: {report['scenarios_per_second']:.0f} scenarios/s")
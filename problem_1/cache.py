@@ -0,0 +1,173 @@
+# Problem 1 - Content-addressed cache for city plans
+
+import hashlib
+import json
+from array import array
+from collections import OrderedDict
+
+from .instance_format import MappedConnections
+
+# Keyword arguments that are filled in by the planner rather than read by it;
+# a cached answer cannot fill them, so such calls go straight to the planner.
+OUT_PARAMETERS = ('report', 'certificate', 'touched', 'stats')
+
+
+def instance_key(planner, num_data_hubs, num_service_providers, connections, provider_capacities,
+                 preliminary_assignment, **options):
+
+    # Canonical form: the sections of the binary instance format
+    # (instance_format.py) as raw int arrays, fed to sha256 section by section.
+    # Hubs are in id order and provider lists in the given order (it can
+    # decide which provider a hub gets). A MappedConnections is hashed straight
+    # from its mapped sections, so a loaded instance has the same key as the
+    # dicts it was written from. Cost: O(n + k + E) on every lookup, hit or
+    # miss, but only array appends and hashing, no per-edge Python objects.
+    if isinstance(connections, MappedConnections):
+        offsets = connections.offsets
+        providers = connections.providers
+        extra_hubs = []
+    else:
+        offsets = array('q', [0])
+        providers = array('i')
+        for hub in range(num_data_hubs):
+            providers.extend(connections.get(hub, ()))
+            offsets.append(len(providers))
+        # Hubs outside 0..n-1 have no CSR row; they are rare enough to hash as plain values
+        extra_hubs = sorted((int(hub), [int(p) for p in connections[hub]])
+                            for hub in connections if not 0 <= hub < num_data_hubs)
+
+    preliminary = array('i')
+    for hub, provider in sorted(preliminary_assignment.items()):
+        preliminary.append(hub)
+        preliminary.append(provider)
+
+    header = {
+        'planner': f"{planner.__module__}.{planner.__qualname__}",
+        'num_data_hubs': num_data_hubs,
+        'num_service_providers': num_service_providers,
+        'num_edges': len(providers),
+        'extra_hubs': extra_hubs,
+        'options': sorted(options.items()),
+    }
+    digest = hashlib.sha256(json.dumps(header, separators=(',', ':')).encode())
+    for section in (offsets, providers, array('i', provider_capacities), preliminary):
+        digest.update(section)
+    return digest.hexdigest()
+
+
+class PlanCache:
+
+    # Bounded in-memory LRU, optionally backed by a sqlite file that survives
+    # restarts and is shared between processes on the same host.
+
+    def __init__(self, maxsize=1024, path=None):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+        self.db = None
+        if path is not None:
+            import sqlite3
+            self.db = sqlite3.connect(path)
+            self.db.execute("CREATE TABLE IF NOT EXISTS plans (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+            self.db.commit()
+
+    def plan(self, planner, num_data_hubs, num_service_providers, connections, provider_capacities,
+             preliminary_assignment, **options):
+
+        if any(options.get(name) is not None for name in OUT_PARAMETERS):
+            self.bypasses += 1
+            return planner(num_data_hubs, num_service_providers, connections, provider_capacities,
+                           preliminary_assignment, **options)
+
+        key = instance_key(planner, num_data_hubs, num_service_providers, connections, provider_capacities,
+                           preliminary_assignment, **options)
+
+        # --- 1. Memory tier ---
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return _copy(self.entries[key])
+
+        # --- 2. Disk tier ---
+        if self.db is not None:
+            row = self.db.execute("SELECT result FROM plans WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                result = json.loads(row[0])
+                self._remember(key, result)
+                return _copy(result)
+
+        # --- 3. Solve and store ---
+        self.misses += 1
+        result = planner(num_data_hubs, num_service_providers, connections, provider_capacities,
+                         preliminary_assignment, **options)
+        self._remember(key, result)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO plans (key, result) VALUES (?, ?)", (key, json.dumps(result)))
+            self.db.commit()
+        return _copy(result)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bypasses': self.bypasses,
+            'size': len(self.entries),
+        }
+
+    def clear(self):
+        self.entries.clear()
+        if self.db is not None:
+            self.db.execute("DELETE FROM plans")
+            self.db.commit()
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def _remember(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+
+def _copy(result):
+    # Callers get their own list so they cannot change the cached answer
+    return list(result) if isinstance(result, list) else result
+
+
+if __name__ == "__main__":
+    import time
+    from .p1_d import plan_city_d
+    from .p1_e import plan_city_e
+
+    # Input from Listing 1, submitted repeatedly
+    instance = dict(
+        num_data_hubs=5,
+        num_service_providers=5,
+        connections={
+            0: [5, 7, 8],
+            1: [5, 8],
+            2: [7, 8, 9],
+            3: [5, 6, 8, 9],
+            4: [5, 6, 7, 8]
+        },
+        provider_capacities=[0]*5 + [0, 1, 0, 2, 2],
+        preliminary_assignment={0: 8, 1: 8, 2: 9, 3: 9}
+    )
+    cache = PlanCache(maxsize=2)
+    for planner in (plan_city_d, plan_city_e, plan_city_e):
+        started = time.perf_counter()
+        result = cache.plan(planner, **instance)
+        print(f"{planner.__name__}: {result} ({(time.perf_counter() - started) * 1e6:.0f} us)")
+    print(f"Cache: {cache.stats()}")
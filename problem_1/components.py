@@ -0,0 +1,115 @@
+# Problem 1 - Connected-component decomposition for the planners
+
+
+def split_components(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+
+    # --- 1. Union-find over hubs and providers (same ids as the planners) ---
+    parent = list(range(num_data_hubs + num_service_providers))
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(a, b):
+        root_a = find(a)
+        root_b = find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    for hub, providers in connections.items():
+        for provider in providers:
+            union(hub, provider)
+    for hub, provider in preliminary_assignment.items():
+        union(hub, provider)
+
+    # --- 2. Group nodes; components without hubs cannot affect the answer ---
+    groups = {}
+    for hub in range(num_data_hubs):
+        groups.setdefault(find(hub), ([], []))[0].append(hub)
+    for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+        root = find(provider)
+        if root in groups:
+            groups[root][1].append(provider)
+
+    # --- 3. Relabel each component as a standalone instance ---
+    # Local ids: hubs 0..h-1, providers h..h+p-1
+    components = []
+    for hubs, providers in groups.values():
+        local = {}
+        for i, hub in enumerate(hubs):
+            local[hub] = i
+        for j, provider in enumerate(providers):
+            local[provider] = len(hubs) + j
+
+        component = {
+            'hubs': hubs,
+            'providers': providers,
+            'num_data_hubs': len(hubs),
+            'num_service_providers': len(providers),
+            'connections': {local[hub]: [local[p] for p in connections.get(hub, ())] for hub in hubs},
+            'provider_capacities': [0] * len(hubs) + [provider_capacities[p] for p in providers],
+            'preliminary_assignment': {local[hub]: local[preliminary_assignment[hub]]
+                                       for hub in hubs if hub in preliminary_assignment},
+        }
+        components.append(component)
+
+    return components
+
+
+def _solve_component(task):
+    planner, component, options = task
+    return planner(component['num_data_hubs'], component['num_service_providers'], component['connections'],
+                   component['provider_capacities'], component['preliminary_assignment'], **options)
+
+
+def solve_components(planner, components, workers, **options):
+
+    # Imported here: the planners only pay for multiprocessing when workers are used
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Largest components first so one big region does not start last
+    order = sorted(range(len(components)), key=lambda i: -len(components[i]['connections']))
+    tasks = [(planner, components[i], options) for i in order]
+
+    results = [None] * len(components)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(tasks) // (4 * (workers or 1)))
+        for i, result in zip(order, executor.map(_solve_component, tasks, chunksize=chunksize)):
+            results[i] = result
+
+    return results
+
+
+def merge_feasibility(components, results):
+    return all(results)
+
+
+def _is_assignment(component, result):
+    # A component without providers can only be infeasible (its indicator vector is all hub zeros)
+    return component['num_service_providers'] > 0 and len(result) == component['num_data_hubs']
+
+
+def merge_plans(num_data_hubs, num_service_providers, components, results):
+
+    # Feasible everywhere: map each component's provider ids back to global ids
+    if all(_is_assignment(component, result) for component, result in zip(components, results)):
+        assignment = [0] * num_data_hubs
+        for component, result in zip(components, results):
+            offset = component['num_data_hubs']
+            for local_hub, local_provider in enumerate(result):
+                assignment[component['hubs'][local_hub]] = component['providers'][local_provider - offset]
+        return assignment
+
+    # Infeasible: nothing is reachable from the source inside a feasible component,
+    # so only the infeasible components contribute indicators.
+    capacity_increase = [0] * (num_data_hubs + num_service_providers)
+    for component, result in zip(components, results):
+        if _is_assignment(component, result):
+            continue
+        offset = component['num_data_hubs']
+        for j, provider in enumerate(component['providers']):
+            capacity_increase[provider] = result[offset + j]
+
+    return capacity_increase
@@ -0,0 +1,448 @@
+# Problem 1 - Sparse flow network shared by the planners
+
+from array import array
+from collections import deque
+
+# Node layout (same as plan_city_d):
+#   S(0), Hubs(1..n), Providers(n+1..n+k), T(n+k+1)
+# Edges are stored CSR-style: the edges leaving node u are
+#   start[u] .. start[u + 1] - 1
+# and for every edge e, rev[e] is the index of its paired reverse edge.
+# head[e] is the node the edge points to, cap[e] its residual capacity.
+# All arrays are flat int32 (array('i')), so an edge costs 12 bytes of
+# storage instead of a hashed dict entry per direction.
+# source_edge[hub] and sink_edge[j] are the ids of the S -> hub and
+# provider (n + j) -> T edges, so those are found without scanning.
+#
+# With overflow=True there is one more node, OVERFLOW(n+k+2), with a
+# zero-capacity provider -> OVERFLOW edge per provider (ids in
+# overflow_edge[j]) and a zero-capacity OVERFLOW -> T edge; raising their
+# capacities lets providers exceed their own capacity.
+
+def build_flow_network(num_data_hubs, num_service_providers, connections, provider_capacities, overflow=False):
+
+    source = 0
+    sink = num_data_hubs + num_service_providers + 1
+    total_nodes = sink + 2 if overflow else sink + 1
+
+    # --- 1. Collect (tail, head, capacity) triples ---
+    tails = array('i')
+    heads = array('i')
+    caps = array('i')
+
+    # S -> Hubs (Capacity 1)
+    for hub in range(num_data_hubs):
+        tails.append(source)
+        heads.append(hub + 1)
+        caps.append(1)
+
+    # Hubs -> Providers (Capacity 1)
+    for hub, provider_list in connections.items():
+        for provider in provider_list:
+            tails.append(hub + 1)
+            heads.append(provider + 1)
+            caps.append(1)
+
+    # Providers -> T (Capacity from provider_capacities)
+    for j in range(num_service_providers):
+        provider = num_data_hubs + j
+        tails.append(provider + 1)
+        heads.append(sink)
+        caps.append(provider_capacities[provider])
+
+    # Providers -> OVERFLOW -> T (Capacity 0 until raised)
+    if overflow:
+        for j in range(num_service_providers):
+            tails.append(num_data_hubs + j + 1)
+            heads.append(sink + 1)
+            caps.append(0)
+        tails.append(sink + 1)
+        heads.append(sink)
+        caps.append(0)
+
+    # --- 2. Degree count (forward + reverse edge per triple) ---
+    degree = array('i', [0]) * (total_nodes + 1)
+    for i in range(len(tails)):
+        degree[tails[i]] += 1
+        degree[heads[i]] += 1
+
+    start = array('i', [0]) * (total_nodes + 1)
+    for u in range(total_nodes):
+        start[u + 1] = start[u] + degree[u]
+
+    # --- 3. Place each edge and its reverse in the CSR arrays ---
+    num_edges = start[total_nodes]
+    head = array('i', [0]) * num_edges
+    cap = array('i', [0]) * num_edges
+    rev = array('i', [0]) * num_edges
+    fill = start[:]
+
+    # Edge ids of the S -> hub and provider -> T triples, recorded as they are placed
+    source_edge = array('i', [0]) * num_data_hubs
+    sink_edge = array('i', [0]) * num_service_providers
+    overflow_edge = array('i', [0]) * num_service_providers if overflow else None
+    first_sink_triple = num_data_hubs + sum(len(provider_list) for provider_list in connections.values())
+    first_overflow_triple = first_sink_triple + num_service_providers
+
+    for i in range(len(tails)):
+        u = tails[i]
+        v = heads[i]
+        e = fill[u]
+        fill[u] += 1
+        r = fill[v]
+        fill[v] += 1
+
+        head[e] = v
+        cap[e] = caps[i]
+        rev[e] = r
+
+        head[r] = u
+        cap[r] = 0
+        rev[r] = e
+
+        if i < num_data_hubs:
+            source_edge[i] = e
+        elif first_sink_triple <= i < first_overflow_triple:
+            sink_edge[i - first_sink_triple] = e
+        elif first_overflow_triple <= i < first_overflow_triple + num_service_providers:
+            overflow_edge[i - first_overflow_triple] = e
+
+    return FlowNetwork(source, sink, start, head, cap, rev, source_edge, sink_edge, overflow_edge)
+
+
+class FlowNetwork:
+
+    def __init__(self, source, sink, start, head, cap, rev, source_edge, sink_edge, overflow_edge=None):
+        self.source = source
+        self.sink = sink
+        self.start = start
+        self.head = head
+        self.cap = cap
+        self.rev = rev
+        self.source_edge = source_edge
+        self.sink_edge = sink_edge
+        self.overflow_edge = overflow_edge
+
+    @property
+    def num_nodes(self):
+        return len(self.start) - 1
+
+    def find_edge(self, u, v):
+        # Returns -1 when there is no u -> v edge
+        for e in range(self.start[u], self.start[u + 1]):
+            if self.head[e] == v:
+                return e
+        return -1
+
+    def push(self, e, amount):
+        self.cap[e] -= amount
+        self.cap[self.rev[e]] += amount
+
+
+def apply_preliminary_assignment(network, preliminary_assignment):
+
+    # Flow path for every assignment: S -> Hub -> Provider -> T. The S and T
+    # edges are looked up by id; only the hub's own edges are scanned.
+    num_data_hubs = len(network.source_edge)
+    num_service_providers = len(network.sink_edge)
+    initial_flow = 0
+    for hub, provider in preliminary_assignment.items():
+        if 0 <= hub < num_data_hubs:
+            network.push(network.source_edge[hub], 1)
+            e = network.find_edge(hub + 1, provider + 1)
+            if e >= 0:
+                network.push(e, 1)
+        if 0 <= provider - num_data_hubs < num_service_providers:
+            network.push(network.sink_edge[provider - num_data_hubs], 1)
+
+        initial_flow += 1
+
+    return initial_flow
+
+
+def dinic_max_flow(network, stats=None):
+
+    source = network.source
+    sink = network.sink
+    start = network.start
+    head = network.head
+    cap = network.cap
+    rev = network.rev
+    total_nodes = network.num_nodes
+
+    max_flow = 0
+
+    while True:
+        # --- 1. Level graph (BFS from the source over residual edges) ---
+        level = [-1] * total_nodes
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for e in range(start[u], start[u + 1]):
+                v = head[e]
+                if cap[e] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+
+        if stats is not None:
+            expanded = [u for u in range(total_nodes) if level[u] >= 0]
+            stats.record_search(len(expanded), sum(start[u + 1] - start[u] for u in expanded))
+
+        if level[sink] < 0:
+            break # No more augmenting paths, max flow achieved
+
+        # --- 2. Blocking flow (iterative DFS with current-edge pointers) ---
+        current = start[:-1]
+        path = []
+        u = source
+
+        while True:
+            if u == sink:
+                # Bottleneck along the path, then push it
+                path_flow = min(cap[e] for e in path)
+                for e in path:
+                    cap[e] -= path_flow
+                    cap[rev[e]] += path_flow
+                max_flow += path_flow
+                if stats is not None:
+                    stats.record_path(len(path), path_flow)
+
+                # Resume from the tail of the first saturated edge
+                for i in range(len(path)):
+                    if cap[path[i]] == 0:
+                        del path[i:]
+                        break
+                u = head[path[-1]] if path else source
+                continue
+
+            # Advance along an admissible edge
+            advanced = False
+            end = start[u + 1]
+            while current[u] < end:
+                e = current[u]
+                v = head[e]
+                if cap[e] > 0 and level[v] == level[u] + 1:
+                    path.append(e)
+                    u = v
+                    advanced = True
+                    break
+                current[u] += 1
+
+            if advanced:
+                continue
+
+            # Retreat: u is a dead end for this phase
+            if u == source:
+                break
+            level[u] = -1
+            e = path.pop()
+            u = head[rev[e]]
+            current[u] += 1
+
+    return max_flow
+
+
+def edmonds_karp_max_flow(network, touched=None, stats=None):
+
+    source = network.source
+    sink = network.sink
+    start = network.start
+    head = network.head
+    cap = network.cap
+    rev = network.rev
+    total_nodes = network.num_nodes
+
+    max_flow = 0
+
+    while True:
+        # BFS for the shortest augmenting path; parent_edge[v] is the edge used to reach v
+        parent_edge = [-1] * total_nodes
+        parent_edge[source] = -2
+        queue = deque([source])
+        while queue and parent_edge[sink] == -1:
+            u = queue.popleft()
+            for e in range(start[u], start[u + 1]):
+                v = head[e]
+                if parent_edge[v] == -1 and cap[e] > 0:
+                    parent_edge[v] = e
+                    if v == sink:
+                        break
+                    queue.append(v)
+
+        if stats is not None:
+            # Expanded: discovered nodes that were taken off the queue
+            waiting = set(queue)
+            expanded = [u for u in range(total_nodes) if parent_edge[u] != -1 and u != sink and u not in waiting]
+            stats.record_search(len(expanded), sum(start[u + 1] - start[u] for u in expanded))
+
+        if parent_edge[sink] == -1:
+            break # No more augmenting paths, max flow achieved
+
+        # Find path flow (bottleneck capacity)
+        path_flow = float('inf')
+        v = sink
+        while v != source:
+            e = parent_edge[v]
+            path_flow = min(path_flow, cap[e])
+            v = head[rev[e]]
+
+        # Update residual capacities in place, only along the path
+        cells = 0
+        v = sink
+        while v != source:
+            e = parent_edge[v]
+            cap[e] -= path_flow
+            cap[rev[e]] += path_flow
+            cells += 2
+            v = head[rev[e]]
+
+        if touched is not None:
+            touched.append(cells)
+        if stats is not None:
+            stats.record_path(cells // 2, path_flow)
+
+        max_flow += path_flow
+
+    return max_flow
+
+
+def push_relabel_max_flow(network, stats=None):
+
+    source = network.source
+    sink = network.sink
+    start = network.start
+    head = network.head
+    cap = network.cap
+    rev = network.rev
+    total_nodes = network.num_nodes
+
+    height = [0] * total_nodes
+    excess = [0] * total_nodes
+    count = [0] * (2 * total_nodes + 1) # number of nodes at each height (for the gap heuristic)
+    current = start[:-1]
+    in_queue = [False] * total_nodes
+    queue = deque()
+    pushes = 0
+    total_relabels = 0
+    gaps = 0
+
+    def global_relabel():
+        # Exact distance labels: distance to the sink, otherwise n + distance to the source.
+        # Returns the number of nodes and adjacency entries the two BFS passes scanned.
+        nodes = 0
+        edges = 0
+        for u in range(total_nodes):
+            height[u] = 2 * total_nodes
+        for base, root in ((0, sink), (total_nodes, source)):
+            height[root] = base
+            bfs = deque([root])
+            while bfs:
+                v = bfs.popleft()
+                nodes += 1
+                edges += start[v + 1] - start[v]
+                for e in range(start[v], start[v + 1]):
+                    u = head[e]
+                    # Residual edge u -> v is the pair of v -> u
+                    if cap[rev[e]] > 0 and height[u] == 2 * total_nodes and u != source:
+                        height[u] = height[v] + 1
+                        bfs.append(u)
+        height[source] = total_nodes
+        for h in range(len(count)):
+            count[h] = 0
+        for u in range(total_nodes):
+            count[height[u]] += 1
+            current[u] = start[u]
+        return nodes, edges
+
+    def enqueue(v):
+        if v != source and v != sink and not in_queue[v] and excess[v] > 0:
+            in_queue[v] = True
+            queue.append(v)
+
+    # --- 1. Saturate every residual edge out of the source ---
+    for e in range(start[source], start[source + 1]):
+        if cap[e] > 0:
+            amount = cap[e]
+            cap[e] -= amount
+            cap[rev[e]] += amount
+            excess[head[e]] += amount
+            excess[source] -= amount
+
+    scanned = [global_relabel()]
+    for u in range(total_nodes):
+        enqueue(u)
+
+    # --- 2. FIFO discharge with gap heuristic and periodic global relabeling ---
+    relabels = 0
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+
+        while excess[u] > 0:
+            if current[u] == start[u + 1]:
+                # Relabel: one above the lowest residual neighbour
+                old_height = height[u]
+                new_height = 2 * total_nodes
+                for e in range(start[u], start[u + 1]):
+                    if cap[e] > 0 and height[head[e]] + 1 < new_height:
+                        new_height = height[head[e]] + 1
+                count[old_height] -= 1
+                height[u] = new_height
+                count[new_height] += 1
+                current[u] = start[u]
+                relabels += 1
+                total_relabels += 1
+
+                # Gap: nodes above an emptied height below n can no longer reach the sink
+                if count[old_height] == 0 and old_height < total_nodes:
+                    gaps += 1
+                    for v in range(total_nodes):
+                        if old_height < height[v] < total_nodes:
+                            count[height[v]] -= 1
+                            height[v] = total_nodes + 1
+                            count[height[v]] += 1
+                            current[v] = start[v]
+                continue
+
+            e = current[u]
+            v = head[e]
+            if cap[e] > 0 and height[u] == height[v] + 1:
+                amount = min(excess[u], cap[e])
+                cap[e] -= amount
+                cap[rev[e]] += amount
+                excess[u] -= amount
+                excess[v] += amount
+                pushes += 1
+                enqueue(v)
+            else:
+                current[u] += 1
+
+        if relabels >= total_nodes:
+            scanned.append(global_relabel())
+            relabels = 0
+
+    if stats is not None:
+        # No augmenting paths here; the global relabels are the BFS passes
+        stats.counters.update(pushes=pushes, relabels=total_relabels, gaps=gaps, global_relabels=len(scanned))
+        for nodes, edges in scanned:
+            stats.record_search(nodes, edges)
+
+    return excess[sink]
+
+
+def reachable_from_source(network):
+
+    visited = [False] * network.num_nodes
+    visited[network.source] = True
+    queue = deque([network.source])
+
+    while queue:
+        u = queue.popleft()
+        for e in range(network.start[u], network.start[u + 1]):
+            v = network.head[e]
+            if not visited[v] and network.cap[e] > 0:
+                visited[v] = True
+                queue.append(v)
+
+    return visited
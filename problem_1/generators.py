@@ -0,0 +1,107 @@
+# Problem 1 - Reproducible synthetic city instances
+#
+# Every generator takes a target number of hub -> provider connections and a
+# seed, and returns the planner keyword arguments (num_data_hubs,
+# num_service_providers, connections, provider_capacities,
+# preliminary_assignment), so `plan_city_d(**instance)` works directly.
+# Hubs get DEGREE connections each; there are PROVIDER_RATIO times fewer
+# providers than hubs.
+
+import random
+from bisect import bisect
+from itertools import accumulate
+
+DEGREE = 5
+PROVIDER_RATIO = 10
+
+
+def _shape(num_edges, degree):
+    num_data_hubs = max(1, num_edges // degree)
+    num_service_providers = max(degree, num_data_hubs // PROVIDER_RATIO)
+    return num_data_hubs, num_service_providers
+
+
+def _instance(num_data_hubs, num_service_providers, connections, capacities):
+    return {
+        'num_data_hubs': num_data_hubs,
+        'num_service_providers': num_service_providers,
+        'connections': connections,
+        'provider_capacities': [0] * num_data_hubs + capacities,
+        'preliminary_assignment': {},
+    }
+
+
+def _split(total, parts, rng):
+    # `total` units over `parts` providers, each getting at least total // parts
+    capacities = [total // parts] * parts
+    for j in rng.sample(range(parts), total % parts):
+        capacities[j] += 1
+    return capacities
+
+
+def uniform_instance(num_edges, seed=0, degree=DEGREE):
+
+    # Every hub picks `degree` distinct providers uniformly at random; total
+    # capacity is 20% above the number of hubs, split evenly.
+    rng = random.Random(seed)
+    n, k = _shape(num_edges, degree)
+    providers = range(n, n + k)
+    connections = {hub: rng.sample(providers, degree) for hub in range(n)}
+    return _instance(n, k, connections, _split(n + n // 5, k, rng))
+
+
+def power_law_instance(num_edges, seed=0, degree=DEGREE, exponent=1.2):
+
+    # Provider popularity follows a Zipf law (weight 1 / rank^exponent), so a
+    # few providers see most of the connections; capacities are still spread
+    # evenly, which makes the popular providers the bottlenecks.
+    rng = random.Random(seed)
+    n, k = _shape(num_edges, degree)
+    cumulative = list(accumulate(1 / (rank ** exponent) for rank in range(1, k + 1)))
+    total_weight = cumulative[-1]
+
+    connections = {}
+    for hub in range(n):
+        chosen = set()
+        while len(chosen) < degree:
+            chosen.add(n + min(k - 1, bisect(cumulative, rng.random() * total_weight)))
+        connections[hub] = list(chosen)
+    return _instance(n, k, connections, _split(n + n // 5, k, rng))
+
+
+def tight_instance(num_edges, seed=0, degree=DEGREE):
+
+    # Planted feasible assignment with zero slack: every hub is connected to
+    # its planted provider plus random others, and each provider's capacity
+    # is exactly its planted load. Feasible, but any max flow must fill every
+    # provider to capacity.
+    rng = random.Random(seed)
+    n, k = _shape(num_edges, degree)
+    planted = [n + rng.randrange(k) for _ in range(n)]
+    capacities = [0] * k
+    connections = {}
+    for hub in range(n):
+        capacities[planted[hub] - n] += 1
+        others = rng.sample(range(n, n + k), degree)
+        connections[hub] = [planted[hub]] + [p for p in others if p != planted[hub]][:degree - 1]
+        rng.shuffle(connections[hub])
+    return _instance(n, k, connections, capacities)
+
+
+def near_infeasible_instance(num_edges, seed=0, degree=DEGREE):
+
+    # The tight instance with one unit of capacity removed: total capacity is
+    # n - 1, so exactly one hub cannot be served and the planners must prove it.
+    instance = tight_instance(num_edges, seed, degree)
+    capacities = instance['provider_capacities']
+    busiest = max(range(instance['num_data_hubs'], len(capacities)), key=capacities.__getitem__)
+    capacities[busiest] -= 1
+    return instance
+
+
+GENERATORS = {
+    'uniform': uniform_instance,
+    'power_law': power_law_instance,
+    'tight': tight_instance,
+    'near_infeasible': near_infeasible_instance,
+}
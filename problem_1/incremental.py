@@ -0,0 +1,185 @@
+# Problem 1 - Incremental re-solve on the p1_e residual graph
+
+from collections import defaultdict
+
+from .p1_e import (SOURCE, SINK, build_residual_graph, maximum_assignment, bfs_find_path,
+                  capacity_increase_indicators)
+
+
+class IncrementalPlanner:
+
+    # Keeps the residual graph of a maximum flow alive between changes.
+    # Every hub carries at most one unit of flow, so the flow is fully described
+    # by `assignment` (hub -> provider) and each change only cancels the unit
+    # paths it breaks and re-augments at most as many times as flow was lost.
+
+    def __init__(self, num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+        self.num_data_hubs = num_data_hubs
+        self.num_service_providers = num_service_providers
+        self.connections = {hub: list(providers) for hub, providers in connections.items()}
+        self.provider_capacities = list(provider_capacities)
+
+        # Warm start: a maximum flow from the fast engines (extending the
+        # preliminary assignment), applied to the residual graph as initial flow
+        initial_assignment = maximum_assignment(num_data_hubs, num_service_providers, connections,
+                                                provider_capacities, preliminary_assignment)
+        self.residual_graph = build_residual_graph(num_data_hubs, num_service_providers, connections,
+                                                   provider_capacities, initial_assignment)
+
+        # Flow on a hub -> provider edge shows up as residual capacity on provider -> hub
+        self.assignment = {}
+        self.provider_hubs = defaultdict(set)
+        for hub, providers in self.connections.items():
+            for provider in providers:
+                if self.residual_graph[provider].get(hub, 0) > 0:
+                    self.assignment[hub] = provider
+                    self.provider_hubs[provider].add(hub)
+                    break
+
+    # --- Changes ---
+
+    def add_connection(self, hub, provider):
+        if provider in self.connections.setdefault(hub, []):
+            return self.result()
+        self.connections[hub].append(provider)
+        self.residual_graph[hub][provider] = 1
+
+        # Max flow grows by at most one
+        self._augment()
+        return self.result()
+
+    def remove_connection(self, hub, provider):
+        if provider not in self.connections.get(hub, ()):
+            return self.result()
+
+        lost = 0
+        if self.assignment.get(hub) == provider:
+            self._cancel(hub)
+            lost = 1
+
+        self.connections[hub].remove(provider)
+        self.residual_graph[hub].pop(provider, None)
+        self.residual_graph[provider].pop(hub, None)
+
+        # Only the cancelled unit can be recovered
+        for _ in range(lost):
+            if not self._augment():
+                break
+        return self.result()
+
+    def set_capacity(self, provider, capacity):
+        old_capacity = self.provider_capacities[provider]
+        self.provider_capacities[provider] = capacity
+        self.residual_graph[provider][SINK] += capacity - old_capacity
+
+        # Shrinking below the current load cancels the excess hubs
+        lost = 0
+        while len(self.provider_hubs[provider]) > max(capacity, 0):
+            self._cancel(next(iter(self.provider_hubs[provider])))
+            lost += 1
+
+        # Re-augment at most by the flow lost or the capacity gained
+        for _ in range(max(lost, capacity - old_capacity)):
+            if not self._augment():
+                break
+        return self.result()
+
+    def fail_provider(self, provider):
+        # Outage: the provider's capacity drops to 0 and the hubs it served are
+        # displaced. Its connections stay, so set_capacity() brings it back.
+        displaced = list(self.provider_hubs[provider])
+        for hub in displaced:
+            self._cancel(hub)
+        self.provider_capacities[provider] = 0
+        self.residual_graph[provider][SINK] = 0
+
+        # No flow enters the provider any more, so it is a dead end for every
+        # search. Paths that were blocked before the outage stay blocked, so
+        # only the displaced hubs need a search, each rooted at the hub itself.
+        for hub in displaced:
+            self._augment_from(hub)
+        return self.result()
+
+    # --- Results ---
+
+    def result(self):
+        # Same contract as plan_city_e: full assignment, or capacity-increase indicators
+        if len(self.assignment) == self.num_data_hubs:
+            return [self.assignment[hub] for hub in range(self.num_data_hubs)]
+
+        return capacity_increase_indicators(self.residual_graph, self.num_data_hubs,
+                                            self.num_service_providers, self.provider_capacities)
+
+    # --- Residual updates ---
+
+    def _cancel(self, hub):
+        # Withdraw the unit path S -> hub -> provider -> T
+        provider = self.assignment.pop(hub)
+        self.provider_hubs[provider].discard(hub)
+
+        residual_graph = self.residual_graph
+        residual_graph[SOURCE][hub] += 1
+        residual_graph[hub][SOURCE] -= 1
+        residual_graph[hub][provider] += 1
+        residual_graph[provider][hub] -= 1
+        residual_graph[provider][SINK] += 1
+        residual_graph[SINK][provider] -= 1
+
+    def _augment(self):
+        parent = bfs_find_path(self.residual_graph, SOURCE, SINK)
+        if parent is None:
+            return False
+        self._apply_path(parent)
+        return True
+
+    def _augment_from(self, hub):
+        # One augmenting-path search rooted at a hub with no flow. The source is
+        # made a dead end so the path cannot trade another hub's service for it.
+        source_edges = self.residual_graph.pop(SOURCE)
+        parent = bfs_find_path(self.residual_graph, hub, SINK)
+        self.residual_graph[SOURCE] = source_edges
+        if parent is None:
+            return False
+        parent[hub] = SOURCE
+        self._apply_path(parent)
+        return True
+
+    def _apply_path(self, parent):
+        # Every hub -> provider edge on the path (re)assigns that hub
+        current = SINK
+        while current != SOURCE:
+            prev = parent[current]
+            self.residual_graph[prev][current] -= 1
+            self.residual_graph[current][prev] += 1
+
+            if prev != SOURCE and current != SINK and prev < self.num_data_hubs:
+                old_provider = self.assignment.get(prev)
+                if old_provider is not None:
+                    self.provider_hubs[old_provider].discard(prev)
+                self.assignment[prev] = current
+                self.provider_hubs[current].add(prev)
+
+            current = prev
+
+
+if __name__ == "__main__":
+    # Input from Listing 1
+    planner = IncrementalPlanner(
+        num_data_hubs=5,
+        num_service_providers=5,
+        connections={
+            0: [5, 7, 8],
+            1: [5, 8],
+            2: [7, 8, 9],
+            3: [5, 6, 8, 9],
+            4: [5, 6, 7, 8]
+        },
+        provider_capacities=[0]*5 + [0, 1, 0, 2, 2],
+        preliminary_assignment={0: 8, 1: 8, 2: 9, 3: 9}
+    )
+    print(f"Initial plan: {planner.result()}")
+    print(f"Link 4-6 down: {planner.remove_connection(4, 6)}")
+    print(f"Provider 7 gets 1 slot: {planner.set_capacity(7, 1)}")
+    print(f"Link 4-9 added: {planner.add_connection(4, 9)}")
+    print(f"Provider 8 down: {planner.fail_provider(8)}")
+    print(f"Provider 8 back with 2 slots: {planner.set_capacity(8, 2)}")
\ No newline at end of file
@@ -0,0 +1,166 @@
+# Problem 1 - Binary, memory-mappable city instances
+#
+# Layout (little-endian, every section starts on an 8-byte boundary):
+#   header       magic b'CITYPLAN', version, num_data_hubs, num_service_providers, num_edges
+#   offsets      int64[num_data_hubs + 1]   CSR offsets into providers, per hub
+#   providers    int32[num_edges]           provider ids, hub by hub
+#   capacities   int32[n + k]               same indexing as provider_capacities
+#   preliminary  int32[num_data_hubs]       assigned provider per hub, -1 if none
+
+import mmap
+import struct
+from array import array
+from collections.abc import Mapping
+
+MAGIC = b'CITYPLAN'
+VERSION = 1
+HEADER = struct.Struct('<8sIIIQ')
+
+
+def _padded(size):
+    return (size + 7) // 8 * 8
+
+
+def write_instance(path, num_data_hubs, num_service_providers, connections, provider_capacities,
+                   preliminary_assignment):
+
+    offsets = array('q', [0])
+    providers = array('i')
+    for hub in range(num_data_hubs):
+        providers.extend(connections.get(hub, ()))
+        offsets.append(len(providers))
+
+    capacities = array('i', provider_capacities)
+    preliminary = array('i', [-1]) * num_data_hubs
+    for hub, provider in preliminary_assignment.items():
+        preliminary[hub] = provider
+
+    with open(path, 'wb') as f:
+        header = HEADER.pack(MAGIC, VERSION, num_data_hubs, num_service_providers, len(providers))
+        for data in (header, offsets.tobytes(), providers.tobytes(), capacities.tobytes(), preliminary.tobytes()):
+            f.write(data)
+            f.write(b'\0' * (_padded(len(data)) - len(data)))
+
+
+class MappedConnections(Mapping):
+
+    # Read-only hub -> providers view over the mapped CSR arrays. Values are
+    # zero-copy memoryview slices, so it can be passed wherever the planners
+    # take a `connections` dict.
+
+    def __init__(self, offsets, providers):
+        self.offsets = offsets
+        self.providers = providers
+
+    def __getitem__(self, hub):
+        if not isinstance(hub, int) or not 0 <= hub < len(self.offsets) - 1:
+            raise KeyError(hub)
+        return self.providers[self.offsets[hub]:self.offsets[hub + 1]]
+
+    def __iter__(self):
+        return iter(range(len(self.offsets) - 1))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class MappedInstance:
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = self._view = memoryview(self._map)
+
+        magic, version, num_data_hubs, num_service_providers, num_edges = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a city instance file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported city instance version {version}")
+
+        self.num_data_hubs = num_data_hubs
+        self.num_service_providers = num_service_providers
+        self.num_edges = num_edges
+
+        # --- Zero-copy typed views into the mapping ---
+        position = _padded(HEADER.size)
+        sections = []
+        for code, count in (('q', num_data_hubs + 1), ('i', num_edges),
+                            ('i', num_data_hubs + num_service_providers), ('i', num_data_hubs)):
+            size = count * (8 if code == 'q' else 4)
+            sections.append(view[position:position + size].cast(code))
+            position += _padded(size)
+        self.offsets, self.providers, self.provider_capacities, self.preliminary = sections
+
+        self.connections = MappedConnections(self.offsets, self.providers)
+
+        # The preliminary assignment is at most one entry per hub, so a dict is cheap
+        self.preliminary_assignment = {hub: provider for hub, provider in enumerate(self.preliminary)
+                                       if provider >= 0}
+
+    def arguments(self):
+        # Keyword arguments for plan_city_d / plan_city_e
+        return {
+            'num_data_hubs': self.num_data_hubs,
+            'num_service_providers': self.num_service_providers,
+            'connections': self.connections,
+            'provider_capacities': self.provider_capacities,
+            'preliminary_assignment': self.preliminary_assignment,
+        }
+
+    def numpy_arrays(self):
+        # Same sections as numpy arrays sharing the mapped memory (numpy is optional)
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.providers, dtype=np.int32),
+                np.frombuffer(self.provider_capacities, dtype=np.int32),
+                np.frombuffer(self.preliminary, dtype=np.int32))
+
+    def close(self):
+        # Views still held by callers (e.g. connection slices) keep the mapping
+        # alive; it is then unmapped when they are garbage collected.
+        self.connections = None
+        for section in (self.offsets, self.providers, self.provider_capacities, self.preliminary, self._view):
+            section.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_instance(path):
+    return MappedInstance(path)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from .p1_d import plan_city_d
+    from .p1_e import plan_city_e
+
+    # Input from Listing 1, round-tripped through the binary format
+    path = os.path.join(tempfile.mkdtemp(), 'listing1.city')
+    write_instance(
+        path,
+        num_data_hubs=5,
+        num_service_providers=5,
+        connections={
+            0: [5, 7, 8],
+            1: [5, 8],
+            2: [7, 8, 9],
+            3: [5, 6, 8, 9],
+            4: [5, 6, 7, 8]
+        },
+        provider_capacities=[0]*5 + [0, 1, 0, 2, 2],
+        preliminary_assignment={0: 8, 1: 8, 2: 9, 3: 9}
+    )
+    with load_instance(path) as instance:
+        print(f"{instance.num_edges} connections, {os.path.getsize(path)} bytes")
+        print(f"plan_city_d: {plan_city_d(**instance.arguments())}")
+        print(f"plan_city_e: {plan_city_e(**instance.arguments())}")
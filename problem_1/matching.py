@@ -0,0 +1,222 @@
+# Problem 1 - Bipartite matching fast path for the planners
+
+from collections import deque
+
+# Providers whose capacity is at most this many slots are expanded into
+# unit-capacity slots, turning the hub -> provider problem into plain
+# bipartite matching that Hopcroft-Karp solves in O(E * sqrt(V)).
+SLOT_EXPANSION_LIMIT = 4
+
+INF = float('inf')
+
+
+def supports_matching(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+
+    # Every provider must be small enough to be expanded into slots
+    for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+        if provider_capacities[provider] > SLOT_EXPANSION_LIMIT:
+            return False
+
+    # The preliminary assignment must be a valid partial matching, otherwise
+    # the generic solvers' treatment of the initial flow applies.
+    load = {}
+    for hub, provider in preliminary_assignment.items():
+        if not 0 <= hub < num_data_hubs or provider not in connections.get(hub, ()):
+            return False
+        load[provider] = load.get(provider, 0) + 1
+        if load[provider] > provider_capacities[provider]:
+            return False
+
+    return True
+
+
+def hopcroft_karp(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment,
+                  stats=None):
+
+    # --- 1. Expand providers into unit slots ---
+    slot_provider = []
+    provider_slots = {}
+    for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+        first = len(slot_provider)
+        slot_provider.extend([provider] * max(provider_capacities[provider], 0))
+        provider_slots[provider] = range(first, len(slot_provider))
+
+    adjacency = [[] for _ in range(num_data_hubs)]
+    for hub, providers in connections.items():
+        for provider in providers:
+            adjacency[hub].extend(provider_slots[provider])
+
+    hub_slot = [-1] * num_data_hubs
+    slot_hub = [-1] * len(slot_provider)
+
+    # --- 2. Seed with the preliminary assignment ---
+    for hub, provider in preliminary_assignment.items():
+        for slot in provider_slots[provider]:
+            if slot_hub[slot] == -1:
+                hub_slot[hub] = slot
+                slot_hub[slot] = hub
+                break
+
+    # --- 3. Phases: BFS layering from free hubs, then vertex-disjoint DFS augmentations ---
+    dist = [INF] * num_data_hubs
+
+    def bfs():
+        queue = deque()
+        for hub in range(num_data_hubs):
+            if hub_slot[hub] == -1:
+                dist[hub] = 0
+                queue.append(hub)
+            else:
+                dist[hub] = INF
+
+        found_free_slot = False
+        while queue:
+            hub = queue.popleft()
+            for slot in adjacency[hub]:
+                owner = slot_hub[slot]
+                if owner == -1:
+                    found_free_slot = True
+                elif dist[owner] == INF:
+                    dist[owner] = dist[hub] + 1
+                    queue.append(owner)
+
+        if stats is not None:
+            expanded = [hub for hub in range(num_data_hubs) if dist[hub] != INF]
+            stats.record_search(len(expanded), sum(len(adjacency[hub]) for hub in expanded))
+        return found_free_slot
+
+    def augment(root):
+        # Iterative DFS along the layered graph; via[i] is the slot taken from stack[i]
+        stack = [root]
+        via = []
+        while stack:
+            hub = stack[-1]
+            descended = False
+            while position[hub] < len(adjacency[hub]):
+                slot = adjacency[hub][position[hub]]
+                position[hub] += 1
+                owner = slot_hub[slot]
+                if owner == -1:
+                    # Free slot: flip the alternating path
+                    via.append(slot)
+                    for i in range(len(stack)):
+                        hub_slot[stack[i]] = via[i]
+                        slot_hub[via[i]] = stack[i]
+                    if stats is not None:
+                        # S -> hub, then hub -> provider / provider -> hub pairs, then provider -> T
+                        stats.record_path(2 * len(stack) + 1, 1)
+                    return True
+                if dist[owner] == dist[hub] + 1:
+                    via.append(slot)
+                    stack.append(owner)
+                    descended = True
+                    break
+
+            if not descended:
+                # Dead end for this phase
+                dist[hub] = INF
+                stack.pop()
+                if via:
+                    via.pop()
+        return False
+
+    while bfs():
+        position = [0] * num_data_hubs
+        for hub in range(num_data_hubs):
+            if hub_slot[hub] == -1:
+                augment(hub)
+
+    # --- 4. Collapse slots back to providers ---
+    hub_provider = [slot_provider[slot] if slot != -1 else -1 for slot in hub_slot]
+    return hub_provider
+
+
+def reachable_from_free_hubs(num_data_hubs, num_service_providers, connections, provider_capacities, hub_provider):
+
+    # Nodes reachable from the source in the residual graph of a maximum
+    # matching: free hubs, then alternate unmatched hub -> provider edges
+    # and matched provider -> hub edges.
+    provider_hubs = {}
+    for hub, provider in enumerate(hub_provider):
+        if provider != -1:
+            provider_hubs.setdefault(provider, []).append(hub)
+
+    visited = set()
+    queue = deque()
+    for hub in range(num_data_hubs):
+        if hub_provider[hub] == -1:
+            visited.add(hub)
+            queue.append(hub)
+
+    while queue:
+        node = queue.popleft()
+        if node < num_data_hubs:
+            for provider in connections.get(node, ()):
+                if provider != hub_provider[node] and provider not in visited:
+                    visited.add(provider)
+                    queue.append(provider)
+        else:
+            for hub in provider_hubs.get(node, ()):
+                if hub not in visited:
+                    visited.add(hub)
+                    queue.append(hub)
+
+    return visited
+
+
+def greedy_matching(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+
+    # Linear-time Karp-Sipser style pre-matching that extends the preliminary
+    # assignment. A hub with exactly one provider that still has room is
+    # always safe to match there (degree-1 rule); when no such hub exists,
+    # the next unassigned hub takes its first provider with room.
+    assignment = dict(preliminary_assignment)
+
+    remaining = {}
+    for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+        remaining[provider] = provider_capacities[provider]
+    for provider in preliminary_assignment.values():
+        remaining[provider] = remaining.get(provider, 0) - 1
+
+    # Available degree of every unassigned hub, and provider -> hubs for updates
+    provider_hubs = {}
+    degree = [0] * num_data_hubs
+    for hub, providers in connections.items():
+        if hub in assignment:
+            continue
+        for provider in providers:
+            provider_hubs.setdefault(provider, []).append(hub)
+            if remaining.get(provider, 0) > 0:
+                degree[hub] += 1
+
+    queue = deque(hub for hub in range(num_data_hubs) if hub not in assignment and degree[hub] == 1)
+    greedy_assigned = 0
+    next_hub = 0
+
+    while True:
+        if queue:
+            hub = queue.popleft()
+            if hub in assignment or degree[hub] == 0:
+                continue
+        else:
+            # No degree-1 hub left: take the next hub that can still be placed
+            while next_hub < num_data_hubs and (next_hub in assignment or degree[next_hub] == 0):
+                next_hub += 1
+            if next_hub == num_data_hubs:
+                break
+            hub = next_hub
+
+        provider = next(p for p in connections[hub] if remaining.get(p, 0) > 0)
+        assignment[hub] = provider
+        greedy_assigned += 1
+        remaining[provider] -= 1
+
+        # A provider that just filled up lowers the degree of its other hubs
+        if remaining[provider] == 0:
+            for other in provider_hubs.get(provider, ()):
+                if other not in assignment:
+                    degree[other] -= 1
+                    if degree[other] == 1:
+                        queue.append(other)
+
+    return assignment, greedy_assigned
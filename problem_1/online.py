@@ -0,0 +1,103 @@
+# Problem 1 - Online hub arrivals on a live residual graph
+
+import time
+
+from .p1_e import SOURCE, SINK, find_reachable_from_source
+from .incremental import IncrementalPlanner
+
+
+class HallViolation:
+
+    # Infeasibility certificate for an arrival: every hub in `hubs` can only be
+    # served by `providers`, whose total capacity is smaller than len(hubs).
+
+    def __init__(self, hub, hubs, providers, capacity):
+        self.hub = hub
+        self.hubs = hubs
+        self.providers = providers
+        self.capacity = capacity
+
+    def __repr__(self):
+        return (f"HallViolation(hub={self.hub}, hubs={sorted(self.hubs)}, "
+                f"providers={sorted(self.providers)}, capacity={self.capacity})")
+
+
+class OnlinePlanner(IncrementalPlanner):
+
+    # Hub ids 0..num_data_hubs-1 are reserved up front (providers keep their
+    # ids n..n+k-1); hubs start offline and come online through arrive().
+
+    def __init__(self, num_data_hubs, num_service_providers, provider_capacities):
+        super().__init__(num_data_hubs, num_service_providers, {}, provider_capacities, {})
+        self.residual_graph[SOURCE].clear()
+        self.online = set()
+        self.latencies = []
+
+    def arrive(self, hub, providers):
+        started = time.perf_counter()
+
+        if hub in self.online:
+            raise ValueError(f"Hub {hub} is already online")
+        self.online.add(hub)
+        self.residual_graph[SOURCE][hub] = 1
+        self.connections[hub] = list(providers)
+        for provider in providers:
+            self.residual_graph[hub][provider] = 1
+
+        # A single augmenting-path search rooted at the new hub; it may reroute
+        # hubs that are already served.
+        if self._augment_from(hub):
+            outcome = dict(self.assignment)
+        else:
+            outcome = self._certificate(hub)
+
+        self.latencies.append(time.perf_counter() - started)
+        return outcome
+
+    def result(self):
+        return dict(self.assignment)
+
+    def latency_summary(self):
+        if not self.latencies:
+            return {'arrivals': 0}
+        ordered = sorted(self.latencies)
+        return {
+            'arrivals': len(ordered),
+            'mean': sum(ordered) / len(ordered),
+            'p50': ordered[len(ordered) // 2],
+            'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            'max': ordered[-1],
+        }
+
+    def _certificate(self, hub):
+        # Everything reachable from the new hub is saturated: the reachable hubs
+        # compete for the reachable providers, which have one slot too few.
+        residual_graph = self.residual_graph
+        source_edges = residual_graph.pop(SOURCE)
+        reachable = find_reachable_from_source(residual_graph, hub)
+        residual_graph[SOURCE] = source_edges
+
+        nodes = [node for node in reachable if node not in (SOURCE, SINK)]
+        hubs = {node for node in nodes if node < self.num_data_hubs}
+        providers = {node for node in nodes if node >= self.num_data_hubs}
+        capacity = sum(max(self.provider_capacities[provider], 0) for provider in providers)
+        return HallViolation(hub, hubs, providers, capacity)
+
+
+if __name__ == "__main__":
+    # Input from Listing 1, with hubs coming online one at a time
+    planner = OnlinePlanner(
+        num_data_hubs=5,
+        num_service_providers=5,
+        provider_capacities=[0]*5 + [0, 1, 0, 2, 2]
+    )
+    arrivals = {
+        0: [5, 7, 8],
+        1: [5, 8],
+        2: [7, 8, 9],
+        3: [5, 6, 8, 9],
+        4: [5, 6, 7, 8]
+    }
+    for hub, providers in arrivals.items():
+        print(f"Hub {hub} online: {planner.arrive(hub, providers)}")
+    print(f"Latency: {planner.latency_summary()}")
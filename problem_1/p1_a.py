@@ -1,74 +1,123 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import sys
+from array import array
 
-def plan_city_a(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+# Above this many hubs the per-edge drawing is unreadable and slow; the
+# aggregated per-provider view is drawn instead.
+AGGREGATE_THRESHOLD = 200
 
-    # --- 1. Initialize Base Flow Network (Capacities C) ---
-    C = nx.DiGraph()
-    source_node = 'S'
-    sink_node = 'T'
-    
-    # 1.1 S -> Hubs (Capacity 1)
-    for i in range(num_data_hubs):
-        C.add_edge(source_node, i, capacity=1)
+# Providers that get their own row in the aggregated view
+AGGREGATE_TOP_PROVIDERS = 20
+
+# Node ids in the residual edge arrays: hubs and providers keep their own ids
+SOURCE_ID = -1
+SINK_ID = -2
+
+def residual_edges(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+
+    # Residual graph after the preliminary assignment flow, as parallel arrays
+    # (tails[i] -> heads[i] with residual capacities[i]; forward[i] is 1 for
+    # remaining original capacity, 0 for a backward edge carrying flow).
+    # Every edge has capacity 1 except provider -> T, so the flow on each edge
+    # is read straight off the assignment instead of a separate flow graph.
+    tails = array('i')
+    heads = array('i')
+    capacities = array('i')
+    forward = array('b')
+
+    def add(u, v, capacity, is_forward):
+        tails.append(u)
+        heads.append(v)
+        capacities.append(capacity)
+        forward.append(is_forward)
+
+    provider_flow = [0] * (num_data_hubs + num_service_providers)
+    for provider in preliminary_assignment.values():
+        provider_flow[provider] += 1
+
+    # --- 1. Forward edges: c_f(u, v) = c(u, v) - f(u, v) ---
+    for hub in range(num_data_hubs):
+        if hub not in preliminary_assignment:
+            add(SOURCE_ID, hub, 1, 1)
 
-    # 1.2 Hubs -> Providers (Capacity 1 based on connections)
     for hub, providers in connections.items():
-        for provider in providers:
-            C.add_edge(hub, provider, capacity=1)
+        assigned = preliminary_assignment.get(hub)
+        # dict.fromkeys: a repeated connection is still a single edge
+        for provider in dict.fromkeys(providers):
+            if provider != assigned:
+                add(hub, provider, 1, 1)
 
-    # 1.3 Providers -> T (Capacity based on provider_capacities)
     for j in range(num_service_providers):
-        provider_node = num_data_hubs + j 
-        cap = provider_capacities[provider_node]
-        C.add_edge(provider_node, sink_node, capacity=cap)
-
-    # --- 2. Calculate Flow F based on Preliminary Assignment ---
-    F = nx.DiGraph()
-    # Initialize all existing edges in F with 0 flow
-    for u, v, data in C.edges(data=True):
-        F.add_edge(u, v, flow=0)
+        provider = num_data_hubs + j
+        residual = provider_capacities[provider] - provider_flow[provider]
+        if residual > 0:
+            add(provider, SINK_ID, residual, 1)
 
-    # Apply the flow for each assignment: S -> u -> v -> T
+    # --- 2. Backward edges: c_f(v, u) = f(u, v) ---
     for hub, provider in preliminary_assignment.items():
-        # S -> Hub (u) flow
-        F[source_node][hub]['flow'] += 1
-        
-        # Hub (u) -> Provider (v) flow
-        F[hub][provider]['flow'] += 1
-        
-        # Provider (v) -> T flow (accumulate if multiple hubs use same provider)
-        F[provider][sink_node]['flow'] += 1
+        add(hub, SOURCE_ID, 1, 0)
+        add(provider, hub, 1, 0)
 
-    # --- 3. Build the Residual Graph R_final (Residual Capacities) ---
-    R_final = nx.DiGraph()
+    for j in range(num_service_providers):
+        provider = num_data_hubs + j
+        if provider_flow[provider] > 0:
+            add(SINK_ID, provider, provider_flow[provider], 0)
 
-    # Define all nodes for iteration
-    all_nodes = list(C.nodes())
-    
-    # 3.1 Forward Edges: c_f(u, v) = c(u, v) - f(u, v)
-    for u, v, data in C.edges(data=True):
-        flow_uv = F.edges[u, v]['flow'] if F.has_edge(u, v) else 0
-        residual_cap = data['capacity'] - flow_uv
-        if residual_cap > 0:
-            R_final.add_edge(u, v, capacity=residual_cap, direction='forward')
-            
-    # 3.2 Backward Edges: c_f(v, u) = f(u, v)
-    for u, v, data in F.edges(data=True):
-        flow_uv = data['flow']
-        if flow_uv > 0:
-            # Add the reverse edge (v -> u) with capacity equal to the flow
-            if R_final.has_edge(v, u):
-                
-                R_final[v][u]['capacity'] += flow_uv 
-            else:
-                R_final.add_edge(v, u, capacity=flow_uv, direction='backward')
+    return tails, heads, capacities, forward
+
+
+def plan_city_a(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment,
+                output_path=None, aggregate=None):
+
+    # --- 1. Residual graph after the preliminary assignment flow ---
+    residual = residual_edges(num_data_hubs, num_service_providers, connections, provider_capacities,
+                              preliminary_assignment)
+
+    # --- 2. Visualization Setup ---
+    # Only drawing needs matplotlib (and networkx for the per-edge view)
+    if aggregate is None:
+        aggregate = num_data_hubs > AGGREGATE_THRESHOLD
+    draw = draw_aggregated_residual if aggregate else draw_residual
+    figsize = (14, 8)
+
+    # Headless: with an output path, render on a standalone Figure with the
+    # Agg canvas and write PNG/SVG (format from the file extension). pyplot
+    # and its process-wide backend are left alone.
+    if output_path is not None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        figure = Figure(figsize=figsize)
+        FigureCanvasAgg(figure)
+        draw(figure, residual, num_data_hubs, num_service_providers)
+        figure.savefig(output_path, bbox_inches='tight')
+    else:
+        import matplotlib.pyplot as plt
+
+        draw(plt.figure(figsize=figsize), residual, num_data_hubs, num_service_providers)
+        plt.show()
+
+
+def residual_digraph(residual):
+
+    # networkx view of residual_edges() for drawing, with the 'S'/'T' node names
+    import networkx as nx
+
+    names = {SOURCE_ID: 'S', SINK_ID: 'T'}
+    G = nx.DiGraph()
+    for u, v, capacity, is_forward in zip(*residual):
+        G.add_edge(names.get(u, u), names.get(v, v), capacity=capacity,
+                   direction='forward' if is_forward else 'backward')
+    return G
+
+
+def draw_residual(figure, residual, num_data_hubs, num_service_providers):
+    import networkx as nx
+
+    G_plot = residual_digraph(residual)
+    source_node = 'S'
+    sink_node = 'T'
+    ax = figure.add_subplot()
 
-    # --- 4. Visualization Setup ---
-    
-    G_plot = R_final
-    plt.figure(figsize=(14, 8))
-    
     pos = {}
     hub_nodes = list(range(num_data_hubs))
     provider_nodes = list(range(num_data_hubs, num_data_hubs + num_service_providers))
@@ -100,26 +149,91 @@ def plan_city_a(num_data_hubs, num_service_providers, connections, provider_capa
         else: 
             node_colors.append('lightgray')
 
-    nx.draw_networkx_nodes(G_plot, pos, node_size=800, node_color=node_colors)
-    nx.draw_networkx_labels(G_plot, pos)
+    nx.draw_networkx_nodes(G_plot, pos, node_size=800, node_color=node_colors, ax=ax)
+    nx.draw_networkx_labels(G_plot, pos, ax=ax)
     
     # Separate Edges by direction for distinct visualization
     forward_edges = [(u, v) for u, v, d in G_plot.edges(data=True) if d.get('direction') == 'forward']
     backward_edges = [(u, v) for u, v, d in G_plot.edges(data=True) if d.get('direction') == 'backward']
 
     # Forward edges (Remaining original capacity) - Gray
-    nx.draw_networkx_edges(G_plot, pos, edgelist=forward_edges, edge_color='gray', arrows=True, arrowsize=20)
+    nx.draw_networkx_edges(G_plot, pos, edgelist=forward_edges, edge_color='gray', arrows=True, arrowsize=20, ax=ax)
     # Backward edges (Flow pushed, allowing cancellation) - Red dashed
-    nx.draw_networkx_edges(G_plot, pos, edgelist=backward_edges, edge_color='red', arrows=True, arrowsize=20, style='dashed')
+    nx.draw_networkx_edges(G_plot, pos, edgelist=backward_edges, edge_color='red', arrows=True, arrowsize=20, style='dashed',
+                           ax=ax)
     
     # Draw Edge Labels (Capacities)
     edge_labels = nx.get_edge_attributes(G_plot, 'capacity')
-    nx.draw_networkx_edge_labels(G_plot, pos, edge_labels=edge_labels, label_pos=0.6, font_size=9)
+    nx.draw_networkx_edge_labels(G_plot, pos, edge_labels=edge_labels, label_pos=0.6, font_size=9, ax=ax)
+
+    ax.set_title("Problem 1.c: Residual Graph after Preliminary Assignment Flow")
+    ax.axis('off')
+
+
+def draw_aggregated_residual(figure, residual, num_data_hubs, num_service_providers):
+
+    # Per-provider totals instead of edges: forward residual edges (hub ->
+    # provider, capacity still free), backward residual capacity (provider ->
+    # hub, flow that can be cancelled) and the provider -> T residual. The
+    # figure has a fixed size whatever the number of providers: the
+    # AGGREGATE_TOP_PROVIDERS most loaded providers get a row each, with one
+    # row for the mean of the rest, and a histogram shows the distribution
+    # over all providers.
+    forward = [0] * num_service_providers
+    backward = [0] * num_service_providers
+    to_sink = [0] * num_service_providers
+
+    tails, heads, capacities, _ = residual
+    for u, v, capacity in zip(tails, heads, capacities):
+        if u < 0:
+            continue
+        if v >= num_data_hubs:
+            forward[v - num_data_hubs] += 1
+        elif u >= num_data_hubs:
+            if v == SINK_ID:
+                to_sink[u - num_data_hubs] += capacity
+            else:
+                backward[u - num_data_hubs] += capacity
+
+    series = (
+        (forward, 'gray', 'forward hub -> provider'),
+        (backward, 'red', 'backward provider -> hub'),
+        (to_sink, '#90EE90', 'provider -> T residual'),
+    )
+
+    # --- 1. Most loaded providers, plus the mean of all others ---
+    ranked = sorted(range(num_service_providers), key=lambda j: (-backward[j], -forward[j]))
+    top = ranked[:AGGREGATE_TOP_PROVIDERS]
+    others = ranked[AGGREGATE_TOP_PROVIDERS:]
+    labels = [str(num_data_hubs + j) for j in top]
+    if others:
+        labels.append(f"other {len(others)} (mean)")
+
+    ax_top, ax_hist = figure.subplots(1, 2)
+    rows = range(len(labels))
+    height = 0.27
+    for offset, (values, color, label) in zip((-height, 0, height), series):
+        widths = [values[j] for j in top]
+        if others:
+            widths.append(sum(values[j] for j in others) / len(others))
+        ax_top.barh([r + offset for r in rows], widths, height=height, color=color, label=label)
+    ax_top.set_yticks(list(rows), labels)
+    ax_top.invert_yaxis()
+    ax_top.set_xlabel("Residual edges / capacity")
+    ax_top.set_ylabel("Service provider")
+    ax_top.legend(loc='best')
+    ax_top.set_title(f"Most loaded providers ({num_service_providers} total)")
+
+    # --- 2. Distribution over all providers ---
+    for values, color, label in series:
+        ax_hist.hist(values, bins=30, histtype='step', linewidth=1.5, color=color, label=label)
+    ax_hist.set_xlabel("Residual edges / capacity per provider")
+    ax_hist.set_ylabel("Providers")
+    ax_hist.set_yscale('log')
+    ax_hist.legend(loc='upper right')
+
+    figure.suptitle(f"Problem 1.c: Residual Graph per Provider ({num_data_hubs} hubs, {len(tails)} edges)")
 
-    plt.title("Problem 1.c: Residual Graph after Preliminary Assignment Flow")
-    plt.axis('off')
-    
-    plt.show()
 
 if __name__ == "__main__":
     # Input from Listing 1
@@ -135,5 +249,7 @@ if __name__ == "__main__":
         },
         # Capacities: [0,0,0,0,0] for hubs, [0,1,0,2,2] for providers 5,6,7,8,9
         provider_capacities=[0]*5 + [0, 1, 0, 2, 2],
-        preliminary_assignment={0: 8, 1: 8, 2: 9, 3: 9}
+        preliminary_assignment={0: 8, 1: 8, 2: 9, 3: 9},
+        # python -m problem_1.p1_a residual.png -> write the figure instead of opening a window
+        output_path=sys.argv[1] if len(sys.argv) > 1 else None
     )
\ No newline at end of file
@@ -1,141 +1,100 @@
 # Problem 1d
 
-import collections
+import sys
+import time
 
-def plan_city_d(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
-    
-    # --- 1. Graph Setup (Residual Capacity Matrix) ---
-    # Nodes: S(0), Hubs(1..n), Providers(n+1..n+k), T(n+k+1)
-    
-    source = 0
-    sink = num_data_hubs + num_service_providers + 1
-    total_nodes = sink + 1
-    
-    # Hubs are indexed 1 to num_data_hubs
-    # Providers are indexed num_data_hubs + 1 to num_data_hubs + num_service_providers
-    
-    capacity = [[0] * total_nodes for _ in range(total_nodes)]
-    flow = [[0] * total_nodes for _ in range(total_nodes)]
-    
-    # Helper to map Hub/Provider ID to Array Index
-    def get_node_index(node_id):
-        if node_id == 'S': return source
-        if node_id == 'T': return sink
-        
-        # Hubs 0 to n-1 map to indices 1 to n
-        if node_id < num_data_hubs:
-            return node_id + 1
-        
-        # Providers n to n+k-1 map to indices n+1 to n+k
-        return node_id + 1
-
-    # --- 1.1 Populate Capacity Matrix C ---
-    
-    # S -> Hubs (Capacity 1)
-    for i in range(num_data_hubs):
-        hub_idx = get_node_index(i)
-        capacity[source][hub_idx] = 1
-
-    # Hubs -> Providers (Capacity 1)
-    for hub_id, provider_list in connections.items():
-        hub_idx = get_node_index(hub_id)
-        for provider_id in provider_list:
-            provider_idx = get_node_index(provider_id)
-            capacity[hub_idx][provider_idx] = 1
-            
-    # Providers -> T (Capacity from provider_capacities)
-    for j in range(num_service_providers):
-        provider_id = num_data_hubs + j
-        provider_idx = get_node_index(provider_id)
-        cap = provider_capacities[provider_id]
-        capacity[provider_idx][sink] = cap
-
-    # --- 1.2 Initialize Flow F based on Preliminary Assignment ---
-    initial_flow = 0
-    for hub_id, provider_id in preliminary_assignment.items():
-        hub_idx = get_node_index(hub_id)
-        provider_idx = get_node_index(provider_id)
-        
-        # Flow path: S -> Hub -> Provider -> T
-        
-        # S -> Hub flow = 1
-        flow[source][hub_idx] += 1
-        
-        # Hub -> Provider flow = 1
-        flow[hub_idx][provider_idx] += 1
-        
-        # Provider -> T flow = 1
-        flow[provider_idx][sink] += 1
-        
-        initial_flow += 1
-
-    # --- 2. Edmonds-Karp Algorithm ---
-    max_flow = initial_flow
-
-    # BFS function to find an augmenting path in the residual graph
-    def bfs(residual_capacity, parent):
-        queue = collections.deque([source])
-        # parent array tracks the path from S to T
-        parent[:] = [-1] * total_nodes
-        parent[source] = source
-        
-        while queue:
-            u = queue.popleft()
-            
-            # Check all nodes v
-            for v in range(total_nodes):
-                # If v is not visited (parent[v] == -1) AND there is remaining capacity
-                if parent[v] == -1 and residual_capacity[u][v] > 0:
-                    parent[v] = u
-                    if v == sink:
-                        return True # Path found
-                    queue.append(v)
-        return False # No path found
-
-    # Edmonds-Karp loop
-    while True:
-        # Create residual capacity graph R_c(u, v) = C(u, v) - F(u, v)
-        residual_capacity = [[0] * total_nodes for _ in range(total_nodes)]
-        for u in range(total_nodes):
-            for v in range(total_nodes):
-                # Forward residual capacity
-                residual_capacity[u][v] = capacity[u][v] - flow[u][v]
-                # Backward residual capacity (equal to current flow on (v, u))
-                residual_capacity[u][v] += flow[v][u]
-        
-        # Find augmenting path using BFS
-        parent = [-1] * total_nodes
-        if not bfs(residual_capacity, parent):
-            break # No more augmenting paths, max flow achieved
-
-        # 3. Find path flow (bottleneck capacity)
-        path_flow = float('inf')
-        s = sink
-        while s != source:
-            path_flow = min(path_flow, residual_capacity[parent[s]][s])
-            s = parent[s]
-            
-        # 4. Update flow on path
-        max_flow += path_flow
-        
-        v = sink
-        while v != source:
-            u = parent[v]
-            # Update flow: subtract path_flow from reverse edge, add to forward edge
-            
-            # Check if (u, v) is a forward edge in the original graph
-            if capacity[u][v] > 0:
-                flow[u][v] += path_flow
+from .components import split_components, solve_components, merge_feasibility
+from .flow_network import (build_flow_network, apply_preliminary_assignment, dinic_max_flow,
+                          edmonds_karp_max_flow, push_relabel_max_flow)
+from .matching import supports_matching, hopcroft_karp, greedy_matching
+from .stats import timed
+
+SOLVERS = ('auto', 'dinic', 'edmonds_karp', 'hopcroft_karp', 'push_relabel')
+
+def plan_city_d(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment,
+                solver='auto', touched=None, workers=None, greedy=False, report=None, stats=None):
+
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}")
+
+    # Independent regions are solved in parallel worker processes and merged back.
+    # Out-parameters filled inside the workers would not come back, so they are refused.
+    if workers is not None and (report is not None or touched is not None):
+        raise ValueError("report and touched cannot be combined with workers")
+    if workers is not None:
+        with timed(stats, 'build'):
+            components = split_components(num_data_hubs, num_service_providers, connections,
+                                          provider_capacities, preliminary_assignment)
+        with timed(stats, 'augmentation'):
+            results = solve_components(plan_city_d, components, workers, solver=solver, greedy=greedy)
+        with timed(stats, 'extraction'):
+            feasible = merge_feasibility(components, results)
+        if stats is not None:
+            stats.solver = 'components'
+            stats.finish()
+        return feasible
+
+    # --- 0. Optional Greedy Pre-Matching ---
+    # Karp-Sipser seeding, so augmenting paths are only searched for the hubs it cannot place.
+    preliminary_count = len(preliminary_assignment)
+    greedy_count = 0
+    if greedy:
+        with timed(stats, 'initial_flow'):
+            preliminary_assignment, greedy_count = greedy_matching(num_data_hubs, num_service_providers, connections,
+                                                                   provider_capacities, preliminary_assignment)
+
+    # --- 0.1 Matching Fast Path ---
+    # With small provider capacities the problem is bipartite matching over provider slots.
+    if solver in ('auto', 'hopcroft_karp') and supports_matching(
+            num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+        if stats is not None:
+            stats.solver = 'hopcroft_karp'
+        with timed(stats, 'augmentation'):
+            hub_provider = hopcroft_karp(num_data_hubs, num_service_providers, connections,
+                                         provider_capacities, preliminary_assignment, stats)
+        max_flow = sum(1 for provider in hub_provider if provider != -1)
+        initial_flow = len(preliminary_assignment)
+    elif solver == 'hopcroft_karp':
+        raise ValueError("hopcroft_karp needs small provider capacities and a valid preliminary assignment")
+    else:
+        # --- 1. Graph Setup (Sparse Residual Network) ---
+        # Nodes: S(0), Hubs(1..n), Providers(n+1..n+k), T(n+k+1)
+        # Edges are stored in CSR arrays with a paired reverse edge each, so memory
+        # grows with the number of connections instead of total_nodes².
+        with timed(stats, 'build'):
+            network = build_flow_network(num_data_hubs, num_service_providers, connections, provider_capacities)
+
+        # --- 1.2 Initialize Flow F based on Preliminary Assignment ---
+        with timed(stats, 'initial_flow'):
+            initial_flow = apply_preliminary_assignment(network, preliminary_assignment)
+
+        # --- 2. Max Flow ---
+        if stats is not None:
+            stats.solver = 'dinic' if solver == 'auto' else solver
+        with timed(stats, 'augmentation'):
+            if solver == 'edmonds_karp':
+                # Residual capacities are updated in place along each augmenting path;
+                # `touched` (if given) collects the number of residual cells written per augmentation.
+                max_flow = initial_flow + edmonds_karp_max_flow(network, touched, stats)
+            elif solver == 'push_relabel':
+                # FIFO push-relabel with gap heuristic, suited to dense connection graphs
+                max_flow = initial_flow + push_relabel_max_flow(network, stats)
             else:
-                # If (u, v) is not in C, it must be a backward edge (v, u) in C
-                flow[v][u] -= path_flow
+                # Dinic's Algorithm (level graph + blocking flow phases)
+                max_flow = initial_flow + dinic_max_flow(network, stats)
 
-            v = parent[v]
+    # Hubs assigned by each phase
+    if report is not None:
+        report['preliminary'] = preliminary_count
+        report['greedy'] = greedy_count
+        report['augmenting'] = max_flow - initial_flow
 
     # --- 3. Result Check ---
     # The max flow should equal the total number of hubs (demand) for all to be connected.
     required_flow = num_data_hubs
-    
+
+    if stats is not None:
+        stats.finish()
     return max_flow == required_flow
 
 if __name__ == "__main__":
@@ -161,4 +120,35 @@ if __name__ == "__main__":
         preliminary_assignment=pre_assignment
     )
     
-    print(f"Can all {num_hubs} data hubs be connected? {is_feasible}")
\ No newline at end of file
+    print(f"Can all {num_hubs} data hubs be connected? {is_feasible}")
+
+    # Benchmark mode: python -m problem_1.p1_d --benchmark
+    # Compares residual cells written per augmentation with the V² cells the
+    # old matrix rebuild touched on every Edmonds-Karp iteration.
+    if '--benchmark' in sys.argv:
+        import random
+        from .stats import SolverStats
+        rng = random.Random(0)
+        bench_hubs = 2000
+        bench_providers = 200
+        bench_connections = {
+            hub: rng.sample(range(bench_hubs, bench_hubs + bench_providers), 5)
+            for hub in range(bench_hubs)
+        }
+        bench_capacities = [0] * bench_hubs + [rng.randint(8, 12) for _ in range(bench_providers)]
+
+        for solver in ('dinic', 'edmonds_karp', 'push_relabel'):
+            touched = []
+            stats = SolverStats()
+            started = time.perf_counter()
+            result = plan_city_d(bench_hubs, bench_providers, bench_connections, bench_capacities, {},
+                                 solver=solver, touched=touched, stats=stats)
+            elapsed = time.perf_counter() - started
+            print(f"{solver}: feasible={result} time={elapsed:.3f}s")
+            print(f"  {stats!r}")
+            print("  phases: " + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in stats.phase_times.items()))
+            if touched:
+                dense_cells = (bench_hubs + bench_providers + 2) ** 2
+                print(f"  augmentations={len(touched)} "
+                      f"residual cells touched per augmentation: avg={sum(touched) / len(touched):.1f} "
+                      f"max={max(touched)} (matrix rebuild: {dense_cells})")
\ No newline at end of file
@@ -2,10 +2,85 @@
 
 from collections import defaultdict, deque
 
-def plan_city_e(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
-
-    SOURCE = 'source'
-    SINK = 'sink'
+from .components import split_components, solve_components, merge_plans
+from .flow_network import (build_flow_network, apply_preliminary_assignment, dinic_max_flow, edmonds_karp_max_flow,
+                          push_relabel_max_flow, reachable_from_source)
+from .matching import supports_matching, hopcroft_karp, reachable_from_free_hubs, greedy_matching
+from .stats import timed
+
+SOURCE = 'source'
+SINK = 'sink'
+
+SOLVERS = ('auto', 'dinic', 'edmonds_karp', 'hopcroft_karp', 'push_relabel')
+
+NETWORK_ENGINES = {
+    'auto': dinic_max_flow,
+    'dinic': dinic_max_flow,
+    'edmonds_karp': edmonds_karp_max_flow,
+    'push_relabel': push_relabel_max_flow,
+}
+
+def plan_city_e(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment,
+                solver='auto', workers=None, exact=False, greedy=False, report=None, certificate=None, stats=None):
+
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}")
+
+    # Independent regions are solved in parallel worker processes and merged back.
+    # Out-parameters filled inside the workers would not come back, so they are refused.
+    if workers is not None and (report is not None or certificate is not None):
+        raise ValueError("report and certificate cannot be combined with workers")
+    if workers is not None:
+        with timed(stats, 'build'):
+            components = split_components(num_data_hubs, num_service_providers, connections,
+                                          provider_capacities, preliminary_assignment)
+        with timed(stats, 'augmentation'):
+            results = solve_components(plan_city_e, components, workers, solver=solver, exact=exact, greedy=greedy)
+        with timed(stats, 'extraction'):
+            result = merge_plans(num_data_hubs, num_service_providers, components, results)
+        if stats is not None:
+            stats.solver = 'components'
+            stats.finish()
+        return result
+
+    # Optional Karp-Sipser pre-matching; hubs assigned by each phase go to `report`
+    if report is not None:
+        report['preliminary'] = len(preliminary_assignment)
+        report['greedy'] = 0
+    if greedy:
+        with timed(stats, 'initial_flow'):
+            preliminary_assignment, greedy_count = greedy_matching(num_data_hubs, num_service_providers, connections,
+                                                                   provider_capacities, preliminary_assignment)
+        if report is not None:
+            report['greedy'] = greedy_count
+
+    # Exact mode: smallest capacity increases instead of 0/1 bottleneck indicators
+    if exact:
+        result = minimum_capacity_increase(num_data_hubs, num_service_providers, connections,
+                                           provider_capacities, preliminary_assignment, report, stats)
+
+    # Matching fast path when provider capacities are small enough to expand into slots
+    elif solver in ('auto', 'hopcroft_karp') and supports_matching(
+            num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+        result = plan_city_e_matching(num_data_hubs, num_service_providers, connections,
+                                      provider_capacities, preliminary_assignment, report, certificate, stats)
+    elif solver == 'hopcroft_karp':
+        raise ValueError("hopcroft_karp needs small provider capacities and a valid preliminary assignment")
+
+    # Integer-indexed CSR residual network; flow is read back from the residuals
+    else:
+        if stats is not None:
+            stats.solver = 'dinic' if solver == 'auto' else solver
+        result = plan_city_e_network(num_data_hubs, num_service_providers, connections,
+                                     provider_capacities, preliminary_assignment, NETWORK_ENGINES[solver], report,
+                                     certificate, stats)
+
+    if stats is not None:
+        stats.finish()
+    return result
+
+
+def build_residual_graph(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
 
     # Residual capacities: residual_graph[u][v]
     residual_graph = defaultdict(lambda: defaultdict(int))
@@ -39,24 +114,11 @@ def plan_city_e(num_data_hubs, num_service_providers, connections, provider_capa
             residual_graph[assigned_provider][SINK] -= 1
             residual_graph[SINK][assigned_provider] += 1
 
-    # Flow graph to track actual flow (not just residual capacities)
-    flow_graph = defaultdict(lambda: defaultdict(int))
-
-    # Initialize flow graph with preliminary assignment
-    for hub, provider in preliminary_assignment.items():
-        flow_graph[SOURCE][hub] = 1
-        flow_graph[hub][provider] = 1
-        flow_graph[provider][SINK] = 1
+    return residual_graph
 
-    # Additional flow we can push on top of preliminary flow
-    max_flow = edmonds_karp_with_flow(residual_graph, SOURCE, SINK, flow_graph)
-    total_flow = len(preliminary_assignment) + max_flow
 
-    # Feasible: all hubs assigned
-    if total_flow >= num_data_hubs:
-        return extract_assignment(flow_graph, num_data_hubs)
+def capacity_increase_indicators(residual_graph, num_data_hubs, num_service_providers, provider_capacities):
 
-    # Infeasible: identify providers to increase capacity
     reachable = find_reachable_from_source(residual_graph, SOURCE)
 
     # First n zeros (for hubs)
@@ -79,35 +141,167 @@ def plan_city_e(num_data_hubs, num_service_providers, connections, provider_capa
     return capacity_increase
 
 
-def edmonds_karp_with_flow(residual_graph, source, sink, flow_graph):
+def minimum_capacity_increase(num_data_hubs, num_service_providers, connections, provider_capacities,
+                              preliminary_assignment, report=None, stats=None):
+
+    if stats is not None:
+        stats.solver = 'dinic'
+
+    # CSR network with an OVERFLOW node behind every provider, closed (capacity 0) for now
+    # Nodes: S(0), Hubs(1..n), Providers(n+1..n+k), T(n+k+1), OVERFLOW(n+k+2)
+    with timed(stats, 'build'):
+        network = build_flow_network(num_data_hubs, num_service_providers, connections, provider_capacities,
+                                     overflow=True)
+    with timed(stats, 'initial_flow'):
+        total_flow = apply_preliminary_assignment(network, preliminary_assignment)
+
+    with timed(stats, 'augmentation'):
+        augmented = dinic_max_flow(network, stats)
+    if report is not None:
+        report['augmenting'] = augmented
+
+    total_flow += augmented
+    if total_flow >= num_data_hubs:
+        with timed(stats, 'extraction'):
+            return network_assignment(network, num_data_hubs)
+
+    # Continue augmenting on the same residual network, now allowing any
+    # provider to exceed its capacity through OVERFLOW. Every further
+    # augmenting path ends in exactly one overflow unit, so the overflow used
+    # is the smallest total increase (n - max flow), split as the paths
+    # dictate. Hubs with no connections stay unassignable whatever the capacities.
+    for e in network.overflow_edge:
+        network.cap[e] = num_data_hubs
+    network.cap[network.find_edge(network.sink + 1, network.sink)] = num_data_hubs
+
+    with timed(stats, 'augmentation'):
+        dinic_max_flow(network, stats)
+
+    # Flow on provider -> OVERFLOW is the residual capacity of its reverse edge
+    with timed(stats, 'extraction'):
+        capacity_increase = [0] * num_data_hubs
+        for e in network.overflow_edge:
+            capacity_increase.append(network.cap[network.rev[e]])
+
+    return capacity_increase
 
-    max_flow = 0
 
-    while True:
-        parent = bfs_find_path(residual_graph, source, sink)
-        if parent is None:
-            break
+def plan_city_e_matching(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment,
+                         report=None, certificate=None, stats=None):
 
-        # Bottleneck along path
-        path_flow = float('inf')
-        current = sink
-        while current != source:
-            prev = parent[current]
-            path_flow = min(path_flow, residual_graph[prev][current])
-            current = prev
+    if stats is not None:
+        stats.solver = 'hopcroft_karp'
 
-        # Apply path_flow along the path
-        current = sink
-        while current != source:
-            prev = parent[current]
-            residual_graph[prev][current] -= path_flow
-            residual_graph[current][prev] += path_flow
-            flow_graph[prev][current] += path_flow
-            current = prev
+    with timed(stats, 'augmentation'):
+        hub_provider = hopcroft_karp(num_data_hubs, num_service_providers, connections,
+                                     provider_capacities, preliminary_assignment, stats)
+    if report is not None:
+        report['augmenting'] = sum(1 for provider in hub_provider if provider != -1) - len(preliminary_assignment)
 
-        max_flow += path_flow
+    # Feasible: all hubs assigned
+    if all(provider != -1 for provider in hub_provider):
+        return hub_provider
+
+    # Infeasible: same min-cut indicators as the flow formulation. At a maximum
+    # matching every provider reachable from a free hub is saturated.
+    with timed(stats, 'extraction'):
+        reachable = reachable_from_free_hubs(num_data_hubs, num_service_providers, connections,
+                                             provider_capacities, hub_provider)
+        if certificate is not None:
+            record_certificate(certificate, hub_provider, reachable)
+
+        capacity_increase = [0] * num_data_hubs
+        for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+            if provider in reachable and provider_capacities[provider] > 0:
+                capacity_increase.append(1)
+            else:
+                capacity_increase.append(0)
+
+    return capacity_increase
+
+
+def plan_city_e_network(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment,
+                        max_flow_engine, report=None, certificate=None, stats=None):
+
+    # Same answer as plan_city_e, computed on the CSR network from flow_network.py
+    # Nodes: S(0), Hubs(1..n), Providers(n+1..n+k), T(n+k+1)
+    with timed(stats, 'build'):
+        network = build_flow_network(num_data_hubs, num_service_providers, connections, provider_capacities)
+    with timed(stats, 'initial_flow'):
+        total_flow = apply_preliminary_assignment(network, preliminary_assignment)
+    with timed(stats, 'augmentation'):
+        augmented = max_flow_engine(network, stats=stats)
+    total_flow += augmented
+    if report is not None:
+        report['augmenting'] = augmented
+
+    with timed(stats, 'extraction'):
+        return network_result(network, total_flow, num_data_hubs, num_service_providers, provider_capacities,
+                              certificate)
+
+
+def network_assignment(network, num_data_hubs):
+
+    # A saturated hub -> provider edge carries the hub's flow; -1 for unassigned hubs
+    assignment = [-1] * num_data_hubs
+    for hub in range(num_data_hubs):
+        hub_idx = hub + 1
+        for e in range(network.start[hub_idx], network.start[hub_idx + 1]):
+            provider_idx = network.head[e]
+            if provider_idx != network.source and network.cap[e] == 0:
+                assignment[hub] = provider_idx - 1
+                break
+    return assignment
 
-    return max_flow
+
+def maximum_assignment(num_data_hubs, num_service_providers, connections, provider_capacities, preliminary_assignment):
+
+    # hub -> provider for a maximum flow extending the preliminary assignment,
+    # on Hopcroft-Karp when the capacities allow it and CSR Dinic otherwise
+    if supports_matching(num_data_hubs, num_service_providers, connections, provider_capacities,
+                         preliminary_assignment):
+        hub_provider = hopcroft_karp(num_data_hubs, num_service_providers, connections,
+                                     provider_capacities, preliminary_assignment)
+    else:
+        network = build_flow_network(num_data_hubs, num_service_providers, connections, provider_capacities)
+        apply_preliminary_assignment(network, preliminary_assignment)
+        dinic_max_flow(network)
+        hub_provider = network_assignment(network, num_data_hubs)
+    return {hub: provider for hub, provider in enumerate(hub_provider) if provider != -1}
+
+
+def network_result(network, total_flow, num_data_hubs, num_service_providers, provider_capacities,
+                   certificate=None):
+
+    # Feasible: all hubs assigned
+    if total_flow >= num_data_hubs:
+        return network_assignment(network, num_data_hubs)
+
+    # Infeasible: providers reachable from the source whose sink edge is saturated.
+    # An over-capacity preliminary assignment leaves a negative residual, which
+    # counts as saturated too.
+    reachable = reachable_from_source(network)
+    if certificate is not None:
+        record_certificate(certificate, network_assignment(network, num_data_hubs),
+                           {node - 1 for node in range(1, network.sink) if reachable[node]})
+
+    capacity_increase = [0] * num_data_hubs
+    for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+        if reachable[provider + 1] and provider_capacities[provider] > 0:
+            sink_edge = network.sink_edge[provider - num_data_hubs]
+            capacity_increase.append(1 if network.cap[sink_edge] <= 0 else 0)
+        else:
+            capacity_increase.append(0)
+
+    return capacity_increase
+
+
+def record_certificate(certificate, hub_provider, reachable):
+
+    # Min-cut certificate for an infeasible result, checkable by verify.py in O(E):
+    # the maximum partial assignment and the hubs/providers reachable from the source.
+    certificate['partial_assignment'] = {hub: provider for hub, provider in enumerate(hub_provider) if provider != -1}
+    certificate['reachable'] = set(reachable)
 
 
 def bfs_find_path(residual_graph, source, sink):
@@ -130,20 +324,6 @@ def bfs_find_path(residual_graph, source, sink):
     return None
 
 
-def extract_assignment(flow_graph, num_data_hubs):
-
-    assignment = [0] * num_data_hubs
-
-    for hub in range(num_data_hubs):
-        for provider, flow in flow_graph[hub].items():
-            # provider is an int and in provider index range
-            if flow > 0 and isinstance(provider, int) and provider >= num_data_hubs:
-                assignment[hub] = provider
-                break
-
-    return assignment
-
-
 def find_reachable_from_source(residual_graph, source):
 
     visited = set([source])
@@ -0,0 +1,79 @@
+# Problem 1 - Opt-in solver instrumentation
+
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+# Shared no-op context for untimed phases
+_UNTIMED = nullcontext()
+
+
+class SolverStats:
+
+    # Filled in by plan_city_d / plan_city_e and the max-flow engines when
+    # passed as `stats=`; without it they skip all bookkeeping. Phases are
+    # 'build' (graph setup), 'initial_flow' (preliminary + greedy seeding),
+    # 'augmentation' (max flow) and 'extraction' (result / indicators).
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.solver = None
+        self.augmentations = 0
+        self.path_lengths = Counter()   # edges on an augmenting path -> number of paths
+        self.bottlenecks = Counter()    # flow pushed along a path -> number of paths
+        self.searches = 0               # BFS / level-graph passes
+        self.nodes_scanned = 0          # nodes expanded over all searches
+        self.edges_scanned = 0          # adjacency entries of the expanded nodes
+        self.counters = Counter()       # engine-specific counts (pushes, relabels, ...)
+        self.phase_times = {}           # phase -> seconds
+
+    def record_search(self, nodes, edges):
+        self.searches += 1
+        self.nodes_scanned += nodes
+        self.edges_scanned += edges
+
+    def record_path(self, length, bottleneck):
+        self.augmentations += 1
+        self.path_lengths[length] += 1
+        self.bottlenecks[bottleneck] += 1
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - started
+
+    def finish(self):
+        if self.callback is not None:
+            self.callback(self)
+
+    def summary(self):
+        lengths = sorted(self.path_lengths.elements())
+        return {
+            'solver': self.solver,
+            'augmentations': self.augmentations,
+            'path_length': {
+                'min': lengths[0] if lengths else 0,
+                'median': lengths[len(lengths) // 2] if lengths else 0,
+                'max': lengths[-1] if lengths else 0,
+                'histogram': dict(sorted(self.path_lengths.items())),
+            },
+            'bottlenecks': dict(sorted(self.bottlenecks.items())),
+            'searches': self.searches,
+            'nodes_scanned': self.nodes_scanned,
+            'edges_scanned': self.edges_scanned,
+            'counters': dict(self.counters),
+            'phase_times': dict(self.phase_times),
+        }
+
+    def __repr__(self):
+        return (f"SolverStats(solver={self.solver!r}, augmentations={self.augmentations}, "
+                f"searches={self.searches}, nodes_scanned={self.nodes_scanned}, "
+                f"edges_scanned={self.edges_scanned})")
+
+
+def timed(stats, name):
+    # Context manager timing one planner phase; a no-op without stats
+    return stats.phase(name) if stats is not None else _UNTIMED
@@ -0,0 +1,114 @@
+# Problem 1 - Linear-time checks for plan_city_e results
+
+from collections import deque
+
+
+def verify_assignment(num_data_hubs, num_service_providers, connections, provider_capacities, assignment):
+
+    # Feasible result: every hub uses one of its connections and no provider
+    # takes more hubs than its capacity. O(n + E).
+    if len(assignment) != num_data_hubs:
+        return False
+
+    load = {}
+    for hub, provider in enumerate(assignment):
+        if not num_data_hubs <= provider < num_data_hubs + num_service_providers:
+            return False
+        if provider not in connections.get(hub, ()):
+            return False
+        load[provider] = load.get(provider, 0) + 1
+        if load[provider] > provider_capacities[provider]:
+            return False
+
+    return True
+
+
+def verify_capacity_increase(num_data_hubs, num_service_providers, connections, provider_capacities,
+                             capacity_increase, certificate):
+
+    # Infeasible result: `certificate` holds the maximum partial assignment and
+    # the source-reachable set that plan_city_e(..., certificate={}) recorded.
+    # O(n + E) overall, no max-flow computation.
+    partial_assignment = certificate['partial_assignment']
+    claimed_reachable = certificate['reachable']
+
+    if len(capacity_increase) != num_data_hubs + num_service_providers:
+        return False
+    if any(capacity_increase[hub] != 0 for hub in range(num_data_hubs)):
+        return False
+
+    # --- 1. The partial assignment is a valid flow that leaves some hub unassigned ---
+    load = {}
+    provider_hubs = {}
+    for hub, provider in partial_assignment.items():
+        if not 0 <= hub < num_data_hubs or provider not in connections.get(hub, ()):
+            return False
+        load[provider] = load.get(provider, 0) + 1
+        if load[provider] > provider_capacities[provider]:
+            return False
+        provider_hubs.setdefault(provider, []).append(hub)
+    if len(partial_assignment) >= num_data_hubs:
+        return False
+
+    # --- 2. Recompute the residual reachable set from the free hubs ---
+    # Residual edges: unused hub -> provider connections, provider -> its assigned hubs.
+    reachable = set()
+    queue = deque()
+    for hub in range(num_data_hubs):
+        if hub not in partial_assignment:
+            reachable.add(hub)
+            queue.append(hub)
+
+    while queue:
+        node = queue.popleft()
+        if node < num_data_hubs:
+            for provider in connections.get(node, ()):
+                if provider != partial_assignment.get(node) and provider not in reachable:
+                    reachable.add(provider)
+                    queue.append(provider)
+        else:
+            # A reachable provider with spare capacity is an augmenting path: the flow was not maximum
+            if load.get(node, 0) < provider_capacities[node]:
+                return False
+            for hub in provider_hubs.get(node, ()):
+                if hub not in reachable:
+                    reachable.add(hub)
+                    queue.append(hub)
+
+    if reachable != set(claimed_reachable):
+        return False
+
+    # --- 3. Indicators: exactly the saturated providers on the source side of the cut ---
+    for provider in range(num_data_hubs, num_data_hubs + num_service_providers):
+        expected = 1 if provider in reachable and provider_capacities[provider] > 0 else 0
+        if capacity_increase[provider] != expected:
+            return False
+
+    return True
+
+
+if __name__ == "__main__":
+    from .p1_e import plan_city_e
+
+    # Input from Listing 1
+    instance = dict(
+        num_data_hubs=5,
+        num_service_providers=5,
+        connections={
+            0: [5, 7, 8],
+            1: [5, 8],
+            2: [7, 8, 9],
+            3: [5, 6, 8, 9],
+            4: [5, 6, 7, 8]
+        },
+        provider_capacities=[0]*5 + [0, 1, 0, 2, 2],
+    )
+    assignment = plan_city_e(preliminary_assignment={0: 8, 1: 8, 2: 9, 3: 9}, **instance)
+    print(f"Assignment {assignment} valid? {verify_assignment(assignment=assignment, **instance)}")
+
+    # Provider 6 loses its only slot, so hub 4 cannot be served
+    instance['provider_capacities'] = [0]*5 + [0, 0, 0, 2, 2]
+    certificate = {}
+    capacity_increase = plan_city_e(preliminary_assignment={}, certificate=certificate, **instance)
+    print(f"Capacity increase {capacity_increase} certified? "
+          f"{verify_capacity_increase(capacity_increase=capacity_increase, certificate=certificate, **instance)}")
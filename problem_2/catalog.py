@@ -0,0 +1,166 @@
+import bisect
+import heapq
+from itertools import accumulate
+
+
+class SupplierCatalog:
+
+    # Index over a fixed `boxes` catalog for repeated package-batch queries.
+    # Each supplier's box sizes are validated, de-duplicated, sorted and packed
+    # into one flat list (supplier s owns flat_boxes[offsets[s]:offsets[s + 1]]),
+    # and suppliers are ordered by their largest box so every supplier too
+    # small for a batch is skipped with one bisect.
+
+    def __init__(self, boxes):
+        self.flat_boxes = []
+        self.offsets = [0]
+        self.max_box = []
+
+        for supplier, supplier_boxes in enumerate(boxes):
+            for box_size in supplier_boxes:
+                if not isinstance(box_size, int) or box_size <= 0:
+                    raise ValueError(f"Supplier {supplier} has an invalid box size {box_size!r}")
+            sorted_boxes = sorted(set(supplier_boxes))
+            self.flat_boxes.extend(sorted_boxes)
+            self.offsets.append(len(self.flat_boxes))
+            self.max_box.append(sorted_boxes[-1] if sorted_boxes else 0)
+
+        # Suppliers by largest box, for the fitting-suffix lookup
+        self.by_max_box = sorted(range(len(self.max_box)), key=self.max_box.__getitem__)
+        self.sorted_max_boxes = [self.max_box[supplier] for supplier in self.by_max_box]
+
+    def __len__(self):
+        return len(self.max_box)
+
+    def boxes(self, supplier):
+        return self.flat_boxes[self.offsets[supplier]:self.offsets[supplier + 1]]
+
+    # --- Queries ---
+
+    def min_waste(self, packages):
+        # Same contract as binary_search: minimum total waste, -1 if no supplier fits
+        return min((waste for waste, _ in self._wastes(packages)), default=-1)
+
+    def top_k(self, packages, k):
+        # The k fitting suppliers with the least waste, as (waste, supplier), best first
+        return heapq.nsmallest(k, self._wastes(packages))
+
+    def assignment(self, packages, supplier):
+        # Smallest fitting box of `supplier` for every package, in input order
+        supplier_boxes = self.boxes(supplier)
+        if packages and (not supplier_boxes or supplier_boxes[-1] < max(packages)):
+            raise ValueError(f"Supplier {supplier} has no box for a package of size {max(packages)}")
+        return [supplier_boxes[bisect.bisect_left(supplier_boxes, package_size)] for package_size in packages]
+
+    def min_waste_pruned(self, packages, report=None):
+        # min_waste with three pruning stages; `report` (if given) gets how many
+        # suppliers each stage removed:
+        #   rejected      largest box smaller than the largest package (one bisect for all)
+        #   bound_pruned  lower bound already >= the best waste found
+        #   abandoned     partial waste reached the best waste mid-evaluation
+        #   evaluated     fully priced
+        counts = {'suppliers': len(self), 'rejected': 0, 'bound_pruned': 0, 'abandoned': 0, 'evaluated': 0}
+        best = -1
+
+        if packages:
+            sorted_packages = sorted(packages)
+            prefix = [0] + list(accumulate(sorted_packages))
+            n = len(sorted_packages)
+            flat_boxes = self.flat_boxes
+            offsets = self.offsets
+
+            first = bisect.bisect_left(self.sorted_max_boxes, sorted_packages[-1])
+            counts['rejected'] = first
+
+            # Lower bound: exact waste of the top segment, i.e. the packages that
+            # go into the smallest box holding the largest package. The other
+            # segments only add waste.
+            candidates = []
+            for supplier in self.by_max_box[first:]:
+                lo = offsets[supplier]
+                top = bisect.bisect_left(flat_boxes, sorted_packages[-1], lo, offsets[supplier + 1])
+                below = bisect.bisect_right(sorted_packages, flat_boxes[top - 1]) if top > lo else 0
+                bound = flat_boxes[top] * (n - below) - (prefix[n] - prefix[below])
+                candidates.append((bound, supplier, lo, top, below))
+            candidates.sort()
+
+            best_waste = float('inf')
+            for i, (bound, supplier, lo, top, upper) in enumerate(candidates):
+                # Candidates are in bound order: nothing after this one can win
+                if bound >= best_waste:
+                    counts['bound_pruned'] = len(candidates) - i
+                    break
+
+                # Remaining segments from the top down, packages (box[j - 1], box[j]] into box[j]
+                waste = bound
+                j = top - 1
+                while upper > 0 and waste < best_waste:
+                    lower = bisect.bisect_right(sorted_packages, flat_boxes[j - 1], 0, upper) if j > lo else 0
+                    waste += flat_boxes[j] * (upper - lower) - (prefix[upper] - prefix[lower])
+                    upper = lower
+                    j -= 1
+
+                if upper > 0:
+                    counts['abandoned'] += 1
+                else:
+                    counts['evaluated'] += 1
+                    best_waste = min(best_waste, waste)
+
+            if best_waste != float('inf'):
+                best = best_waste
+
+        if report is not None:
+            report.update(counts)
+        return best
+
+    # --- Internals ---
+
+    def _wastes(self, packages):
+        # (waste, supplier) for every supplier that fits the batch
+        if not packages:
+            return
+
+        sorted_packages = sorted(packages)
+        total = sum(sorted_packages)
+        n = len(sorted_packages)
+
+        first = bisect.bisect_left(self.sorted_max_boxes, sorted_packages[-1])
+        flat_boxes = self.flat_boxes
+        offsets = self.offsets
+        for supplier in self.by_max_box[first:]:
+            # Packages in (previous box, box] go into `box`; waste = volume - total size
+            volume = 0
+            assigned = 0
+            for i in range(offsets[supplier], offsets[supplier + 1]):
+                box_size = flat_boxes[i]
+                insert_pos = bisect.bisect_right(sorted_packages, box_size, assigned)
+                volume += box_size * (insert_pos - assigned)
+                assigned = insert_pos
+                if assigned == n:
+                    break
+            yield volume - total, supplier
+
+
+def pruned_search(packages, boxes, report=None):
+    # One-shot form of SupplierCatalog.min_waste_pruned with binary_search's arguments
+    if not packages or not boxes:
+        return -1
+    return SupplierCatalog(boxes).min_waste_pruned(packages, report)
+
+
+# Test cases
+if __name__ == "__main__":
+    from p2_b import binary_search
+
+    # Catalog from Example 3, queried with several package batches
+    boxes = [[12], [11, 9], [10, 5, 14]]
+    catalog = SupplierCatalog(boxes)
+    for packages in ([3, 5, 8, 10, 11, 12], [2, 3, 5], [15], [1, 9]):
+        print(f"Packages {packages}:")
+        print(f"  min_waste = {catalog.min_waste(packages)} (binary_search: {binary_search(packages, boxes)})")
+        print(f"  top_k(2) = {catalog.top_k(packages, 2)}")
+
+    report = {}
+    print(f"Pruned min_waste: {catalog.min_waste_pruned([3, 5, 8, 10, 11, 12], report)} {report}")
+    print(f"Assignment for supplier 2: {catalog.assignment([3, 5, 8, 10, 11, 12], 2)}")
+    print(f"Expected: [5, 5, 10, 10, 14, 14]")
@@ -46,6 +46,106 @@ def binary_search(packages, boxes):
     return min_waste if min_waste != float('inf') else -1
 
 
+def prefix_sum_search(packages, boxes):
+
+    if not packages or not boxes:
+        return -1
+
+    import bisect
+
+    n = len(packages)
+
+    # Sort packages once and take their total size: O(n log n)
+    sorted_packages = sorted(packages)
+    total_size = sum(sorted_packages)
+    largest_package = sorted_packages[-1]
+
+    min_waste = float('inf')
+
+    # Iterate through each supplier: O(b log n) each after sorting its boxes
+    for supplier_boxes in boxes:
+        # A supplier without a box for the largest package cannot ship everything
+        if not supplier_boxes or max(supplier_boxes) < largest_package:
+            continue
+
+        # Packages in (previous box, box] all go into `box` (smallest box that fits),
+        # so only the total box volume is needed; waste = volume - total package size.
+        volume = 0
+        assigned = 0
+        for box_size in sorted(supplier_boxes):
+            insert_pos = bisect.bisect_right(sorted_packages, box_size, assigned)
+            volume += box_size * (insert_pos - assigned)
+            assigned = insert_pos
+            if assigned == n:
+                break
+
+        min_waste = min(min_waste, volume - total_size)
+
+    # Return result
+    return min_waste if min_waste != float('inf') else -1
+
+
+def vectorized_search(packages, boxes):
+
+    if not packages or not boxes:
+        return -1
+
+    # numpy is optional; only this engine needs it
+    import numpy as np
+    from itertools import chain
+
+    # Every box * count term and every supplier's volume is at most max box * n;
+    # beyond int64 the exact pure-Python engine takes over.
+    n = len(packages)
+    lengths = np.fromiter(map(len, boxes), dtype=np.int64, count=len(boxes))
+    try:
+        sorted_packages = np.sort(np.asarray(packages, dtype=np.int64))
+        flat_boxes = np.fromiter(chain.from_iterable(boxes), dtype=np.int64, count=int(lengths.sum()))
+    except OverflowError:
+        return prefix_sum_search(packages, boxes)
+    if len(flat_boxes) == 0:
+        return -1
+    min_box = int(flat_boxes.min())
+    max_box = int(flat_boxes.max())
+    if max(abs(min_box), abs(max_box), abs(int(sorted_packages[0])), int(sorted_packages[-1])) * n >= 2 ** 63:
+        return prefix_sum_search(packages, boxes)
+    total_packages = int(sorted_packages.sum())
+
+    # --- 1. Sort boxes within each supplier ---
+    # One sort of (supplier, box) packed into an int64 key when it fits, else a lexsort
+    span = max_box - min_box + 1
+    supplier_ids = np.repeat(np.arange(len(boxes), dtype=np.int64), lengths)
+    if len(boxes) * span < 2 ** 63:
+        flat_boxes = np.sort(supplier_ids * span + (flat_boxes - min_box)) % span + min_box
+    else:
+        flat_boxes = flat_boxes[np.lexsort((flat_boxes, supplier_ids))]
+
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    nonempty = lengths > 0
+    starts = starts[nonempty]
+    ends = starts + lengths[nonempty]
+
+    # --- 2. Number of packages each box takes (smallest box that fits) ---
+    # Searching each distinct size once (sorted queries) beats searching every
+    # box; for small sizes a table indexed by size is cheaper still.
+    if min_box >= 0 and max_box < 4 * len(flat_boxes):
+        positions = np.searchsorted(sorted_packages, np.arange(max_box + 1), side='right')[flat_boxes]
+    else:
+        sizes, inverse = np.unique(flat_boxes, return_inverse=True)
+        positions = np.searchsorted(sorted_packages, sizes, side='right')[inverse]
+    previous = np.empty_like(positions)
+    previous[1:] = positions[:-1]
+    previous[starts] = 0
+
+    # --- 3. Per-supplier volume with a segment reduction ---
+    volume = np.add.reduceat(flat_boxes * (positions - previous), starts)
+    fits = flat_boxes[ends - 1] >= sorted_packages[-1]
+    if not fits.any():
+        return -1
+
+    return int(volume[fits].min()) - total_packages
+
+
 # Test cases
 if __name__ == "__main__":
     # Example 1
@@ -119,4 +219,21 @@ if __name__ == "__main__":
     print(f"Test 6 (Performance):")
     print(f"Input: 100 packages [1..100], 2 suppliers")
     print(f"Output: {result6}")
-    print(f"Expected: 0 or minimal waste")
\ No newline at end of file
+    print(f"Expected: 0 or minimal waste")
+    print()
+
+    # Prefix-sum engine: same answers, O(b log n) per supplier
+    for packages, boxes in ((packages1, boxes1), (packages2, boxes2), (packages3, boxes3),
+                            (packages4, boxes4), (packages5, boxes5), (packages6, boxes6)):
+        assert prefix_sum_search(packages, boxes) == binary_search(packages, boxes)
+    print(f"prefix_sum_search matches binary_search on all tests above")
+
+    try:
+        import numpy
+    except ImportError:
+        print(f"numpy not installed, skipping vectorized_search")
+    else:
+        for packages, boxes in ((packages1, boxes1), (packages2, boxes2), (packages3, boxes3),
+                                (packages4, boxes4), (packages5, boxes5), (packages6, boxes6)):
+            assert vectorized_search(packages, boxes) == binary_search(packages, boxes)
+        print(f"vectorized_search matches binary_search on all tests above")
@@ -0,0 +1,94 @@
+import bisect
+import heapq
+from collections import Counter
+
+from catalog import SupplierCatalog
+
+
+class WasteTracker:
+
+    # Running minimum waste over a SupplierCatalog while packages stream in
+    # and out. Each package adds (smallest fitting box - size) to every
+    # supplier that can hold it, found by bisect in the packed catalog; a
+    # supplier without a box for some current package is `missing` it and
+    # is not eligible. Every update changes every supplier's waste, so the
+    # heap of eligible (waste, supplier) pairs is rebuilt in O(m) with
+    # heapify, and the current answer is its top in O(1).
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.waste = [0] * len(catalog)
+        self.missing = [0] * len(catalog)
+        self.packages = Counter()
+        self.num_packages = 0
+        self.heap = []
+
+    # --- Updates ---
+
+    def add_package(self, package_size):
+        self.packages[package_size] += 1
+        self._update(package_size, 1)
+        return self.min_waste()
+
+    def remove_package(self, package_size):
+        if self.packages[package_size] == 0:
+            raise ValueError(f"No package of size {package_size} to remove")
+        self.packages[package_size] -= 1
+        self._update(package_size, -1)
+        return self.min_waste()
+
+    # --- Queries (O(1)) ---
+
+    def min_waste(self):
+        # Same contract as binary_search on the current packages: -1 if there are none or nothing fits
+        if self.num_packages == 0 or not self.heap:
+            return -1
+        return self.heap[0][0]
+
+    def best_supplier(self):
+        if self.num_packages == 0 or not self.heap:
+            return -1
+        return self.heap[0][1]
+
+    def top_k(self, k):
+        return heapq.nsmallest(k, self.heap) if self.num_packages else []
+
+    # --- Internals ---
+
+    def _update(self, package_size, sign):
+        catalog = self.catalog
+        flat_boxes = catalog.flat_boxes
+        offsets = catalog.offsets
+        waste = self.waste
+        missing = self.missing
+        self.num_packages += sign
+
+        # Suppliers are ordered by largest box: the ones too small for this package come first
+        first = bisect.bisect_left(catalog.sorted_max_boxes, package_size)
+        for supplier in catalog.by_max_box[:first]:
+            missing[supplier] += sign
+        for supplier in catalog.by_max_box[first:]:
+            box_size = flat_boxes[bisect.bisect_left(flat_boxes, package_size, offsets[supplier],
+                                                     offsets[supplier + 1])]
+            waste[supplier] += sign * (box_size - package_size)
+
+        self.heap = [(waste[supplier], supplier) for supplier in range(len(waste)) if missing[supplier] == 0]
+        heapq.heapify(self.heap)
+
+
+# Test cases
+if __name__ == "__main__":
+    from p2_b import binary_search
+
+    # Catalog from Example 3, packages arriving one at a time
+    boxes = [[12], [11, 9], [10, 5, 14]]
+    tracker = WasteTracker(SupplierCatalog(boxes))
+    packages = []
+    for package_size in [3, 5, 8, 10, 11, 12]:
+        packages.append(package_size)
+        waste = tracker.add_package(package_size)
+        print(f"Add {package_size}: min_waste = {waste}, supplier = {tracker.best_supplier()} "
+              f"(binary_search: {binary_search(packages, boxes)})")
+
+    packages.remove(12)
+    print(f"Remove 12: min_waste = {tracker.remove_package(12)} (binary_search: {binary_search(packages, boxes)})")